@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+DYdX v4 runner for the data tester, exec tester and market maker examples.
+
+All three examples share the same instrument, logging, client and timeout
+configuration, so they are built from this single entry point. The
+`dydx_v4_data_tester.py`, `dydx_v4_exec_tester.py` and `dydx_v4_market_maker.py`
+scripts are thin shims over this module.
+
+Prerequisites:
+  - Environment variables:
+      DYDX_WALLET_ADDRESS (or DYDX_TESTNET_WALLET_ADDRESS for testnet)
+      DYDX_MNEMONIC (or DYDX_TESTNET_MNEMONIC for testnet, exec/mm modes only)
+
+Usage:
+  python dydx_v4_runner.py --mode {data,exec,mm}
+
+Set DYDX_DEBUG=1 to log every data event in data mode and INFO-level
+messages in mm mode; both are off by default to keep the per-event path cheap.
+
+"""
+
+import argparse
+import os
+from decimal import Decimal
+
+from nautilus_trader.adapters.dydx_v4 import (
+    DYDX_VENUE,
+    DYDXv4DataClientConfig,
+    DYDXv4ExecClientConfig,
+    DYDXv4LiveDataClientFactory,
+    DYDXv4LiveExecClientFactory,
+)
+from nautilus_trader.cache.config import CacheConfig
+from nautilus_trader.config import InstrumentProviderConfig, LiveExecEngineConfig, LoggingConfig, TradingNodeConfig
+from nautilus_trader.examples.strategies.volatility_market_maker import (
+    VolatilityMarketMaker,
+    VolatilityMarketMakerConfig,
+)
+from nautilus_trader.live.config import LiveRiskEngineConfig
+from nautilus_trader.live.node import TradingNode
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import InstrumentId, Symbol, TraderId
+from nautilus_trader.portfolio.config import PortfolioConfig
+from nautilus_trader.test_kit.strategies.tester_data import DataTester, DataTesterConfig
+from nautilus_trader.test_kit.strategies.tester_exec import ExecTester, ExecTesterConfig
+
+# *** THESE ARE TEST STRATEGIES WITH NO ALPHA ADVANTAGE WHATSOEVER. ***
+# *** THEY ARE NOT INTENDED TO BE USED TO TRADE LIVE WITH REAL MONEY. ***
+
+MODES = ("data", "exec", "mm")
+
+# Per-event logging is opt-in (see module docstring)
+debug = bool(os.environ.get("DYDX_DEBUG"))
+
+# dYdX v4 perpetual markets
+# All instruments follow {BASE}-{QUOTE}-PERP.DYDX naming
+symbol = "ETH-USD-PERP"
+instrument_id = InstrumentId(Symbol(symbol), DYDX_VENUE)
+bar_type = BarType.from_str(f"{instrument_id}-1-MINUTE-LAST-EXTERNAL")
+
+# Order parameters
+order_qty = Decimal("0.01")  # exec tester
+trade_size = Decimal("0.010")  # market maker
+
+# Only load (and reconcile) the traded instrument
+instrument_provider_config = InstrumentProviderConfig(
+    load_all=False,
+    load_ids=frozenset([instrument_id]),
+)
+
+logging_config = LoggingConfig(
+    log_level="INFO",
+    use_pyo3=True,
+)
+
+data_client_config = DYDXv4DataClientConfig(
+    wallet_address=None,  # 'DYDX_WALLET_ADDRESS' or 'DYDX_TESTNET_WALLET_ADDRESS' env var
+    instrument_provider=instrument_provider_config,
+    is_testnet=False,  # Mainnet by default; flip to True for testnet
+)
+
+exec_client_config = DYDXv4ExecClientConfig(
+    wallet_address=None,  # 'DYDX_WALLET_ADDRESS' or 'DYDX_TESTNET_WALLET_ADDRESS' env var
+    mnemonic=None,  # 'DYDX_MNEMONIC' or 'DYDX_TESTNET_MNEMONIC' env var
+    subaccount=0,  # Default subaccount (created after first deposit/trade)
+    base_url_http=None,  # Override with custom endpoint
+    base_url_ws=None,  # Override with custom endpoint
+    base_url_grpc=None,  # Override with custom gRPC endpoint
+    instrument_provider=instrument_provider_config,
+    is_testnet=False,  # Mainnet by default; flip to True for testnet
+)
+
+timeouts = {
+    "timeout_connection": 20.0,
+    "timeout_reconciliation": 10.0,
+    "timeout_portfolio": 10.0,
+    "timeout_disconnection": 10.0,
+}
+
+
+def _data_tester_node_config() -> TradingNodeConfig:
+    return TradingNodeConfig(
+        trader_id=TraderId("DYDX-DATA-TESTER-001"),
+        logging=logging_config,
+        data_clients={"DYDX": data_client_config},
+        timeout_post_stop=1.0,
+        **timeouts,
+    )
+
+
+def _exec_tester_node_config() -> TradingNodeConfig:
+    return TradingNodeConfig(
+        trader_id=TraderId("DYDX-EXEC-TESTER-001"),
+        logging=logging_config,
+        exec_engine=LiveExecEngineConfig(
+            reconciliation=True,
+            reconciliation_lookback_mins=1440,  # 24 hours
+            reconciliation_instrument_ids=[instrument_id],
+            # Periodic checks only catch state changed outside this node (e.g. manual cancels),
+            # normal order lifecycle events arrive over the websocket without waiting on them
+            open_check_interval_secs=5.0,
+            open_check_open_only=False,
+            position_check_interval_secs=5.0,
+            graceful_shutdown_on_exception=True,
+        ),
+        risk_engine=LiveRiskEngineConfig(bypass=True),
+        portfolio=PortfolioConfig(min_account_state_logging_interval_ms=1_000),
+        data_clients={"DYDX": data_client_config},
+        exec_clients={"DYDX": exec_client_config},
+        timeout_post_stop=5.0,
+        **timeouts,
+    )
+
+
+def _market_maker_node_config() -> TradingNodeConfig:
+    return TradingNodeConfig(
+        trader_id=TraderId("DYDX-V4-MM-001"),
+        # Every book delta and bar hits the strategy, so only warnings are logged by default
+        logging=logging_config if debug else LoggingConfig(log_level="WARNING", use_pyo3=True),
+        exec_engine=LiveExecEngineConfig(
+            reconciliation=True,
+            reconciliation_lookback_mins=1440,
+        ),
+        # Short flush interval and int64 ns timestamps keep cache writes off the quoting path
+        cache=CacheConfig(
+            timestamps_as_iso8601=False,
+            buffer_interval_ms=10,
+        ),
+        data_clients={"DYDX": data_client_config},
+        exec_clients={"DYDX": exec_client_config},
+        timeout_post_stop=5.0,
+        **timeouts,
+    )
+
+
+def _data_tester() -> DataTester:
+    config_tester = DataTesterConfig(
+        instrument_ids=[instrument_id],
+        bar_types=[bar_type],
+        subscribe_instrument=True,
+        subscribe_quotes=True,
+        subscribe_trades=True,
+        subscribe_book_deltas=True,
+        subscribe_funding_rates=True,
+        manage_book=True,
+        log_data=debug,
+    )
+    return DataTester(config=config_tester)
+
+
+def _exec_tester() -> ExecTester:
+    # Note: dYdX v4 does NOT support:
+    #   - Batch submit/modify/cancel
+    #   - OCO, iceberg, or bracket orders (emulated only)
+    #   - Trailing stop orders
+    #   - MKT_IF_TOUCHED, LMT_IF_TOUCHED (only STOP_MARKET, STOP_LIMIT)
+    config_tester = ExecTesterConfig(
+        instrument_id=instrument_id,
+        external_order_claims=[instrument_id],
+        subscribe_quotes=True,
+        subscribe_trades=True,
+        enable_limit_buys=True,
+        enable_limit_sells=True,
+        enable_stop_buys=False,  # Stop orders require long-term orders with DYDXOrderTags
+        enable_stop_sells=False,  # Stop orders require long-term orders with DYDXOrderTags
+        order_qty=order_qty,
+        tob_offset_ticks=500,  # Definitely out of the market
+        use_post_only=True,  # dYdX supports post-only for maker orders
+        reduce_only_on_stop=True,  # dYdX supports reduce-only
+        cancel_orders_on_stop=True,
+        close_positions_on_stop=True,
+        log_data=False,
+    )
+    return ExecTester(config=config_tester)
+
+
+def _market_maker() -> VolatilityMarketMaker:
+    strat_config = VolatilityMarketMakerConfig(
+        instrument_id=instrument_id,
+        external_order_claims=[instrument_id],
+        bar_type=bar_type,
+        atr_period=20,
+        atr_multiple=3.0,
+        trade_size=trade_size,
+    )
+    return VolatilityMarketMaker(config=strat_config)
+
+
+def build_node(mode: str) -> TradingNode:
+    """
+    Build a trading node for the given mode.
+
+    Parameters
+    ----------
+    mode : str
+        One of ``"data"`` (DataTester actor), ``"exec"`` (ExecTester strategy)
+        or ``"mm"`` (VolatilityMarketMaker strategy).
+
+    Returns
+    -------
+    TradingNode
+        The built node, ready to ``run()``.
+
+    """
+    if mode == "data":
+        node = TradingNode(config=_data_tester_node_config())
+        node.trader.add_actor(_data_tester())
+    elif mode == "exec":
+        node = TradingNode(config=_exec_tester_node_config())
+        node.trader.add_strategy(_exec_tester())
+    elif mode == "mm":
+        node = TradingNode(config=_market_maker_node_config())
+        node.trader.add_strategy(_market_maker())
+    else:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+
+    # Register your client factories with the node (using v4 Rust-backed factories)
+    node.add_data_client_factory("DYDX", DYDXv4LiveDataClientFactory)
+    if mode != "data":
+        node.add_exec_client_factory("DYDX", DYDXv4LiveExecClientFactory)
+    node.build()
+    return node
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a dYdX v4 example node.")
+    parser.add_argument("--mode", choices=MODES, required=True)
+    args = parser.parse_args(argv)
+
+    node = build_node(args.mode)
+
+    # Stop and dispose of the node with SIGINT/CTRL+C
+    try:
+        node.run()
+    finally:
+        node.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,9 +19,11 @@
 # %%
 
 import os
-import threading
-import time
+from array import array
+from collections import deque
+from itertools import chain
 
+import numpy as np
 from ibapi.common import MarketDataTypeEnum as IBMarketDataTypeEnum
 
 from nautilus_trader.adapters.interactive_brokers.common import IB
@@ -48,9 +50,36 @@ from nautilus_trader.trading.config import StrategyConfig
 from nautilus_trader.trading.strategy import Strategy
 
 
+# %%
+_SIDE_SIGN = {OrderSide.BUY: 1, OrderSide.SELL: -1}
+
+# Log colors bound once, they are passed on every log call
+_BLUE = LogColor.BLUE
+_CYAN = LogColor.CYAN
+_GREEN = LogColor.GREEN
+_MAGENTA = LogColor.MAGENTA
+_YELLOW = LogColor.YELLOW
+
+# Section separators for the log output
+_BAR80 = "=" * 80
+_BAR60 = "=" * 60
+
+# Steady-state quote ticks are logged every N ticks
+_QUOTE_LOG_EVERY = 10
+
+# Cap on the number of recent order/fill events kept for inspection
+_MAX_EVENTS = 10_000
+
+# Order event status labels recorded in `order_events`
+_SUBMITTED = "SUBMITTED"
+_ACCEPTED = "ACCEPTED"
+_REJECTED = "REJECTED"
+
+
 # %%
 class SpreadTestConfig(StrategyConfig, frozen=True):
     spread_instrument_id: InstrumentId
+    log_quote_ticks: bool = True  # Set False to only count quote ticks (e.g. for long runs)
 
 
 # %%
@@ -61,22 +90,34 @@ class SpreadTestStrategy(Strategy):
 
     def __init__(self, config: SpreadTestConfig):
         super().__init__(config=config)
+        self._spread_id = config.spread_instrument_id
         self.order_placed = False
-        self.execution_events: list[OrderFilled] = []
-        self.order_events: list[OrderAccepted | OrderSubmitted | OrderRejected] = []
+        # Only the most recent events are kept, the counts below cover the whole run
+        self.execution_events: deque[OrderFilled] = deque(maxlen=_MAX_EVENTS)
+        # Fill side (+1 BUY / -1 SELL) and whole-contract quantity as parallel arrays for the on_stop tallies
+        self._fill_side = array("b")
+        self._fill_qty = array("q")
+        self.order_events: deque[tuple[str, OrderAccepted | OrderSubmitted | OrderRejected]] = deque(
+            maxlen=_MAX_EVENTS,
+        )
+        self.order_event_count = 0
         self.quote_tick_count = 0
+        self._next_log_tick = _QUOTE_LOG_EVERY  # Next steady-state tick to log
         self.instrument_loaded = False
 
     def on_start(self):
         """
         Handle strategy start event.
         """
-        self.log.info("=" * 80, color=LogColor.BLUE)
+        self.log.info(_BAR80, color=_BLUE)
         self.log.info(
             "SPREAD INSTRUMENT - DYNAMIC LOADING",
-            color=LogColor.BLUE,
+            color=_BLUE,
         )
-        self.log.info("=" * 80, color=LogColor.BLUE)
+        self.log.info(_BAR80, color=_BLUE)
+
+        if not self.config.log_quote_ticks:
+            self.on_quote_tick = self._count_quote_tick
 
         # Request the spread instrument dynamically (not pre-loaded)
         self.log.info("Requesting spread instrument dynamically...")
@@ -86,13 +127,14 @@ class SpreadTestStrategy(Strategy):
         """
         Handle instrument response and place order.
         """
-        self.log.info(f"Received instrument: {instrument.id}")
-        self.log.info(f"Instrument type: {type(instrument)}")
-
-        # Mark instrument as loaded and subscribe to quote ticks
-        self.instrument_loaded = True
-        self.log.info("Subscribing to quote ticks for spread instrument...")
+        # Subscribe before anything else. This cannot move to on_start: the IB data client
+        # resolves the contract from its instrument provider, and the spread is only known
+        # there once this response arrives.
         self.subscribe_quote_ticks(instrument.id)
+        self.instrument_loaded = True
+
+        self.log.debug(f"Received instrument: {instrument.id}")
+        self.log.info("Subscribed to quote ticks for spread instrument")
 
         # Place order immediately after getting instrument
         if not self.order_placed:
@@ -102,9 +144,9 @@ class SpreadTestStrategy(Strategy):
         """
         Place a market order for the futures calendar spread.
         """
-        self.log.info("=" * 60, color=LogColor.GREEN)
-        self.log.info("PLACING SPREAD MARKET ORDER (DAY)", color=LogColor.GREEN)
-        self.log.info("=" * 60, color=LogColor.GREEN)
+        self.log.info(_BAR60, color=_GREEN)
+        self.log.info("PLACING SPREAD MARKET ORDER (DAY)", color=_GREEN)
+        self.log.info(_BAR60, color=_GREEN)
 
         # Create market order for 3 spread units (DAY required for combo orders)
         order = self.order_factory.market(
@@ -127,71 +169,98 @@ class SpreadTestStrategy(Strategy):
 
         self.log.info(
             "Market order submitted for futures calendar spread",
-            color=LogColor.GREEN,
+            color=_GREEN,
         )
 
     def on_quote_tick(self, tick):
         """
         Handle quote tick events for the spread instrument.
+
+        Logs the first few ticks in detail, then hands over to
+        `_on_quote_tick_steady` for the rest of the run.
         """
         self.quote_tick_count += 1
+        count = self.quote_tick_count
+        log_info = self.log.info
 
         # Log first few quote ticks to verify subscription is working
-        if self.quote_tick_count <= 5:
-            self.log.info("=" * 60, color=LogColor.CYAN)
-            self.log.info(f"QUOTE TICK #{self.quote_tick_count} RECEIVED", color=LogColor.CYAN)
-            self.log.info("=" * 60, color=LogColor.CYAN)
-            self.log.info(f"   Instrument: {tick.instrument_id}")
-            self.log.info(f"   Bid: {tick.bid_price} @ {tick.bid_size}")
-            self.log.info(f"   Ask: {tick.ask_price} @ {tick.ask_size}")
-            self.log.info(f"   Spread: {float(tick.ask_price) - float(tick.bid_price):.4f}")
-            self.log.info(f"   Event Time: {tick.ts_event}")
-        elif self.quote_tick_count == 6:
-            self.log.info(
-                f"Quote tick subscription working! Received {self.quote_tick_count} ticks so far...",
-                color=LogColor.GREEN,
+        if count <= 5:
+            log_info(_BAR60, color=_CYAN)
+            log_info(f"QUOTE TICK #{count} RECEIVED", color=_CYAN)
+            log_info(_BAR60, color=_CYAN)
+            log_info(f"   Instrument: {tick.instrument_id}")
+            log_info(f"   Bid: {tick.bid_price} @ {tick.bid_size}")
+            log_info(f"   Ask: {tick.ask_price} @ {tick.ask_size}")
+            log_info(f"   Spread: {tick.ask_price.as_double() - tick.bid_price.as_double():.4f}")
+            log_info(f"   Event Time: {tick.ts_event}")
+        else:
+            log_info(
+                f"Quote tick subscription working! Received {count} ticks so far...",
+                color=_GREEN,
             )
-        elif self.quote_tick_count % 10 == 0:
+            # Only the periodic log remains from here on, so skip the branches above
+            self.on_quote_tick = self._on_quote_tick_steady
+
+    def _on_quote_tick_steady(self, tick):
+        """
+        Handle quote tick events once the subscription has been verified.
+        """
+        self.quote_tick_count += 1
+        count = self.quote_tick_count
+
+        if count >= self._next_log_tick:
             # Log every 10th tick after the first 5
+            self._next_log_tick += _QUOTE_LOG_EVERY
             self.log.info(
-                f"Quote tick #{self.quote_tick_count}: Bid={tick.bid_price}, Ask={tick.ask_price}",
-                color=LogColor.CYAN,
+                f"Quote tick #{count}: Bid={tick.bid_price}, Ask={tick.ask_price}",
+                color=_CYAN,
             )
 
+    def _count_quote_tick(self, tick):
+        """
+        Count quote ticks without logging them.
+        """
+        self.quote_tick_count += 1
+
     def on_order_submitted(self, event: OrderSubmitted):
         """
         Handle order submitted events.
         """
-        self.order_events.append(("SUBMITTED", event))
+        self.order_events.append((_SUBMITTED, event))
+        self.order_event_count += 1
         self.log.info(
             f"ORDER SUBMITTED: {event.client_order_id} | Account: {event.account_id}",
-            color=LogColor.BLUE,
+            color=_BLUE,
         )
 
     def on_order_accepted(self, event: OrderAccepted):
         """
         Handle order accepted events.
         """
-        self.order_events.append(("ACCEPTED", event))
+        self.order_events.append((_ACCEPTED, event))
+        self.order_event_count += 1
         self.log.info(
             f"ORDER ACCEPTED: {event.client_order_id} | Venue Order ID: {event.venue_order_id}",
-            color=LogColor.GREEN,
+            color=_GREEN,
         )
 
     def on_order_rejected(self, event: OrderRejected):
         """
         Handle order rejected events.
         """
-        self.order_events.append(("REJECTED", event))
+        self.order_events.append((_REJECTED, event))
+        self.order_event_count += 1
         self.log.error(f"ORDER REJECTED: {event.client_order_id} | Reason: {event.reason}")
 
     def on_order_filled(self, event: OrderFilled):
         """Handle order filled events - KEY for understanding ratio spread execution."""
         self.execution_events.append(event)
+        self._fill_side.append(_SIDE_SIGN.get(event.order_side, 0))
+        self._fill_qty.append(int(event.last_qty))
 
-        self.log.info("=" * 80, color=LogColor.MAGENTA)
-        self.log.info(f"FILL #{len(self.execution_events)} RECEIVED", color=LogColor.MAGENTA)
-        self.log.info("=" * 80, color=LogColor.MAGENTA)
+        self.log.info(_BAR80, color=_MAGENTA)
+        self.log.info(f"FILL #{len(self._fill_side)} RECEIVED", color=_MAGENTA)
+        self.log.info(_BAR80, color=_MAGENTA)
 
         self.log.info(f"   Client Order ID: {event.client_order_id}")
         self.log.info(f"   Venue Order ID: {event.venue_order_id}")
@@ -212,46 +281,47 @@ class SpreadTestStrategy(Strategy):
         """
         Analyze what the fill represents.
         """
-        self.log.info("FILL ANALYSIS:", color=LogColor.YELLOW)
+        self.log.info("FILL ANALYSIS:", color=_YELLOW)
 
-        fill_qty = int(event.last_qty.as_double())
+        fill_qty = int(event.last_qty)
+        order_side = event.order_side
 
-        if event.order_side == OrderSide.BUY:
-            self.log.info(f"   LONG leg fill: {fill_qty} contracts", color=LogColor.CYAN)
-            self.log.info("   Expected: 1 contract per spread unit", color=LogColor.CYAN)
-        elif event.order_side == OrderSide.SELL:
-            self.log.info(f"   SHORT leg fill: {fill_qty} contracts", color=LogColor.CYAN)
-            self.log.info("   Expected: 1 contract per spread unit (ESH6)", color=LogColor.CYAN)
+        if order_side == OrderSide.BUY:
+            self.log.info(f"   LONG leg fill: {fill_qty} contracts", color=_CYAN)
+            self.log.info("   Expected: 1 contract per spread unit", color=_CYAN)
+        elif order_side == OrderSide.SELL:
+            self.log.info(f"   SHORT leg fill: {fill_qty} contracts", color=_CYAN)
+            self.log.info("   Expected: 1 contract per spread unit (ESH6)", color=_CYAN)
 
         # Check if this is spread-level or leg-level fill
-        if str(event.instrument_id) == str(self.config.spread_instrument_id):
-            self.log.info("   SPREAD-LEVEL FILL", color=LogColor.GREEN)
+        if event.instrument_id == self._spread_id:
+            self.log.info("   SPREAD-LEVEL FILL", color=_GREEN)
         else:
-            self.log.info(f"   LEG-LEVEL FILL: {event.instrument_id}", color=LogColor.YELLOW)
+            self.log.info(f"   LEG-LEVEL FILL: {event.instrument_id}", color=_YELLOW)
 
     def _check_portfolio_state(self):
         """
         Check current portfolio positions.
         """
-        self.log.info("PORTFOLIO STATE:", color=LogColor.CYAN)
+        self.log.info("PORTFOLIO STATE:", color=_CYAN)
 
         cache = self.cache
-        all_positions = list(cache.positions_open()) + list(cache.positions_closed())
-
-        if not all_positions:
-            self.log.info("   No positions in portfolio")
-            return
+        has_positions = False
 
-        for position in all_positions:
+        for position in chain(cache.positions_open(), cache.positions_closed()):
+            has_positions = True
             self.log.info(f"   {position.instrument_id}: {position.side} {position.quantity}")
 
+        if not has_positions:
+            self.log.info("   No positions in portfolio")
+
     def on_stop(self):
         """
         Handle strategy stop and provide final analysis.
         """
-        self.log.info("\n" + "=" * 80, color=LogColor.BLUE)
-        self.log.info("FINAL TEST ANALYSIS", color=LogColor.BLUE)
-        self.log.info("=" * 80, color=LogColor.BLUE)
+        self.log.info("\n" + _BAR80, color=_BLUE)
+        self.log.info("FINAL TEST ANALYSIS", color=_BLUE)
+        self.log.info(_BAR80, color=_BLUE)
 
         # Dynamic loading analysis
         self.log.info(
@@ -260,26 +330,30 @@ class SpreadTestStrategy(Strategy):
         self.log.info(f"Quote ticks received: {self.quote_tick_count}")
 
         # Order and execution analysis
-        self.log.info(f"Total fills received: {len(self.execution_events)}")
-        self.log.info(f"Total order events: {len(self.order_events)}")
+        self.log.info(f"Total fills received: {len(self._fill_side)}")
+        self.log.info(f"Total order events: {self.order_event_count}")
 
-        if self.execution_events:
-            buy_fills = [e for e in self.execution_events if e.order_side == OrderSide.BUY]
-            sell_fills = [e for e in self.execution_events if e.order_side == OrderSide.SELL]
+        if self._fill_side:
+            sides = np.frombuffer(self._fill_side, dtype=np.int8)
+            qtys = np.frombuffer(self._fill_qty, dtype=np.int64)
+            is_buy = sides == 1
+            is_sell = sides == -1
 
-            buy_qty = sum(int(f.last_qty.as_double()) for f in buy_fills)
-            sell_qty = sum(int(f.last_qty.as_double()) for f in sell_fills)
+            buy_count = int(is_buy.sum())
+            sell_count = int(is_sell.sum())
+            buy_qty = int(qtys[is_buy].sum())
+            sell_qty = int(qtys[is_sell].sum())
 
-            self.log.info(f"BUY fills: {len(buy_fills)} (total qty: {buy_qty})")
-            self.log.info(f"SELL fills: {len(sell_fills)} (total qty: {sell_qty})")
+            self.log.info(f"BUY fills: {buy_count} (total qty: {buy_qty})")
+            self.log.info(f"SELL fills: {sell_count} (total qty: {sell_qty})")
 
             # Expected: 3 long (ESZ5), 3 short (ESH6) for 3 spread units
             self.log.info("Expected for 3 spread units: 3 long (ESZ5), 3 short (ESH6)")
 
             if buy_qty == 3 and sell_qty == 3:
-                self.log.info("EXECUTION MATCHES EXPECTED RATIOS", color=LogColor.GREEN)
+                self.log.info("EXECUTION MATCHES EXPECTED RATIOS", color=_GREEN)
             else:
-                self.log.info("EXECUTION PATTERN UNCLEAR", color=LogColor.YELLOW)
+                self.log.info("EXECUTION PATTERN UNCLEAR", color=_YELLOW)
         else:
             self.log.info("No fills received")
 
@@ -370,24 +444,22 @@ print()
 def auto_stop_node(node, delay_seconds=15):
     """
     Automatically stop the node after a delay.
-    """
 
-    def stop_after_delay():
-        time.sleep(delay_seconds)
-        node.stop()
-
-    thread = threading.Thread(target=stop_after_delay)
-    thread.daemon = True
-    thread.start()
+    The stop is scheduled on the node's own event loop, so it fires on the loop's
+    monotonic clock once `node.run()` starts and no extra thread is involved.
+    """
+    return node.get_event_loop().call_later(delay_seconds, node.stop)
 
 
 # %%
 # Start auto-stop timer (10 seconds to observe tickReqParams behavior)
-auto_stop_node(node, delay_seconds=10)
+auto_stop = auto_stop_node(node, delay_seconds=10)
 
 try:
     node.run()
 except KeyboardInterrupt:
     node.stop()
 finally:
+    # Drop the pending stop if the run ended early (e.g. CTRL+C)
+    auto_stop.cancel()
     node.dispose()
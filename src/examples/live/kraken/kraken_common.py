@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Shared node setup for the Kraken data and exec tester examples.
+
+Both testers use the same logging, data client and timeout configuration. The
+exec tester additionally enables reconciliation and an execution client.
+"""
+
+import functools
+from collections.abc import Mapping
+
+from nautilus_trader.adapters.kraken import (
+    KRAKEN,
+    KrakenDataClientConfig,
+    KrakenEnvironment,
+    KrakenExecClientConfig,
+    KrakenLiveDataClientFactory,
+    KrakenLiveExecClientFactory,
+    KrakenProductType,
+)
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import InstrumentProviderConfig, LiveExecEngineConfig, LoggingConfig, TradingNodeConfig
+from nautilus_trader.live.node import TradingNode
+from nautilus_trader.model.identifiers import InstrumentId, TraderId
+from nautilus_trader.trading.strategy import Strategy
+
+# Shared by the data and execution clients
+instrument_provider_config = InstrumentProviderConfig(load_all=True)
+
+
+def resolve_instrument_id(
+    symbol_formats: Mapping[KrakenProductType, str],
+    product_type: KrakenProductType,
+    token: str,
+) -> InstrumentId:
+    """
+    Return the instrument ID for `token` using the tester's symbol format for `product_type`.
+    """
+    if product_type not in symbol_formats:
+        raise ValueError(f"Unsupported product type: {product_type}")
+    return _instrument_id(symbol_formats[product_type], token)
+
+
+@functools.cache
+def _instrument_id(symbol_format: str, token: str) -> InstrumentId:
+    symbol = symbol_format.format(token=token)
+    return InstrumentId.from_str(f"{symbol}.{KRAKEN}")
+
+
+@functools.cache
+def node_config(
+    environment: KrakenEnvironment,
+    product_type: KrakenProductType,
+    with_exec: bool = False,
+    use_spot_position_reports: bool = False,
+) -> TradingNodeConfig:
+    """
+    Return the trading node config for a Kraken tester.
+
+    Configs are immutable, so repeated calls with the same settings (e.g. notebook
+    re-runs) reuse the same object.
+    """
+    product_types = (product_type,)
+    data_clients = {
+        KRAKEN: KrakenDataClientConfig(
+            api_key=None,  # 'KRAKEN_API_KEY' env var
+            api_secret=None,  # 'KRAKEN_API_SECRET' env var
+            environment=environment,
+            product_types=product_types,
+            instrument_provider=instrument_provider_config,
+        ),
+    }
+    logging = LoggingConfig(
+        log_level="INFO",
+        # log_level_file="DEBUG",
+        use_pyo3=True,
+    )
+
+    if not with_exec:
+        return TradingNodeConfig(
+            trader_id=TraderId("TESTER-001"),
+            logging=logging,
+            exec_engine=LiveExecEngineConfig(
+                reconciliation=False,  # Not applicable
+            ),
+            data_clients=data_clients,
+            timeout_connection=30.0,
+            timeout_disconnection=10.0,
+            timeout_post_stop=5.0,
+        )
+
+    return TradingNodeConfig(
+        trader_id=TraderId("TESTER-001"),
+        logging=logging,
+        exec_engine=LiveExecEngineConfig(
+            reconciliation=True,
+            reconciliation_lookback_mins=1440,
+            open_check_interval_secs=5.0,
+            open_check_open_only=False,
+            position_check_interval_secs=30.0,
+            # snapshot_orders=True,
+            # snapshot_positions=True,
+            # snapshot_positions_interval_secs=5.0,
+            # purge_closed_orders_interval_mins=1,
+            # purge_closed_orders_buffer_mins=0,
+            # purge_closed_positions_interval_mins=1,
+            # purge_closed_positions_buffer_mins=0,
+            # purge_account_events_interval_mins=1,
+            # purge_account_events_lookback_mins=0,
+            # purge_from_database=False,
+            # graceful_shutdown_on_exception=True,
+        ),
+        data_clients=data_clients,
+        exec_clients={
+            KRAKEN: KrakenExecClientConfig(
+                api_key=None,  # 'KRAKEN_API_KEY' env var
+                api_secret=None,  # 'KRAKEN_API_SECRET' env var
+                environment=environment,
+                product_types=product_types,
+                instrument_provider=instrument_provider_config,
+                use_spot_position_reports=use_spot_position_reports,
+                spot_positions_quote_currency="USDT",
+            ),
+        },
+        timeout_connection=30.0,
+        timeout_reconciliation=10.0,
+        timeout_portfolio=10.0,
+        timeout_disconnection=10.0,
+        timeout_post_stop=5.0,
+    )
+
+
+def build_node(config: TradingNodeConfig, component: Actor) -> TradingNode:
+    """
+    Build a trading node for `config` running the given actor or strategy.
+
+    The execution client factory is only registered when `config` has exec clients.
+    """
+    # Instantiate the node with a configuration
+    node = TradingNode(config=config)
+
+    # Add your actors/strategies and modules
+    if isinstance(component, Strategy):
+        node.trader.add_strategy(component)
+    else:
+        node.trader.add_actor(component)
+
+    # Register your client factories with the node
+    node.add_data_client_factory(KRAKEN, KrakenLiveDataClientFactory)
+    if config.exec_clients:
+        node.add_exec_client_factory(KRAKEN, KrakenLiveExecClientFactory)
+    node.build()
+    return node
@@ -14,19 +14,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.adapters.kraken import KRAKEN
-from nautilus_trader.adapters.kraken import KrakenDataClientConfig
+from kraken_common import build_node
+from kraken_common import node_config
+from kraken_common import resolve_instrument_id
+
 from nautilus_trader.adapters.kraken import KrakenEnvironment
-from nautilus_trader.adapters.kraken import KrakenLiveDataClientFactory
 from nautilus_trader.adapters.kraken import KrakenProductType
-from nautilus_trader.config import InstrumentProviderConfig
-from nautilus_trader.config import LiveExecEngineConfig
-from nautilus_trader.config import LoggingConfig
-from nautilus_trader.config import TradingNodeConfig
-from nautilus_trader.live.node import TradingNode
 from nautilus_trader.model.data import BarType
-from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.test_kit.strategies.tester_data import DataTester
 from nautilus_trader.test_kit.strategies.tester_data import DataTesterConfig
 
@@ -38,48 +32,19 @@ from nautilus_trader.test_kit.strategies.tester_data import DataTesterConfig
 product_type = KrakenProductType.FUTURES  # SPOT or FUTURES
 token = "ETH"
 
-# Symbol and settings based on product type
-if product_type == KrakenProductType.SPOT:
-    symbol = f"{token}/USD"
-    environment = KrakenEnvironment.MAINNET
-elif product_type == KrakenProductType.FUTURES:
+# Symbol format per product type
+SYMBOL_FORMATS = {
+    KrakenProductType.SPOT: "{token}/USD",
     # Kraken Futures perpetual symbols use PI_ prefix (e.g., PI_XBTUSD, PI_ETHUSD)
-    symbol = f"PI_{token}USD"
-    environment = KrakenEnvironment.MAINNET
-    # environment = KrakenEnvironment.DEMO  # Use demo-futures.kraken.com
-else:
-    raise ValueError(f"Unsupported product type: {product_type}")
-
-instrument_id = InstrumentId.from_str(f"{symbol}.{KRAKEN}")
-product_types = (product_type,)
+    KrakenProductType.FUTURES: "PI_{token}USD",
+}
 
-# Configure the trading node
-config_node = TradingNodeConfig(
-    trader_id=TraderId("TESTER-001"),
-    logging=LoggingConfig(
-        log_level="INFO",
-        # log_level_file="DEBUG",
-        use_pyo3=True,
-    ),
-    exec_engine=LiveExecEngineConfig(
-        reconciliation=False,  # Not applicable
-    ),
-    data_clients={
-        KRAKEN: KrakenDataClientConfig(
-            api_key=None,  # 'KRAKEN_API_KEY' env var
-            api_secret=None,  # 'KRAKEN_API_SECRET' env var
-            environment=environment,
-            product_types=product_types,
-            instrument_provider=InstrumentProviderConfig(load_all=True),
-        ),
-    },
-    timeout_connection=30.0,
-    timeout_disconnection=10.0,
-    timeout_post_stop=5.0,
-)
+instrument_id = resolve_instrument_id(SYMBOL_FORMATS, product_type, token)
+environment = KrakenEnvironment.MAINNET
+# environment = KrakenEnvironment.DEMO  # Futures only, use demo-futures.kraken.com
 
-# Instantiate the node with a configuration
-node = TradingNode(config=config_node)
+# Configure the trading node (see kraken_common.py)
+config_node = node_config(environment, product_type)
 
 # Configure and initialize the tester
 config_tester = DataTesterConfig(
@@ -100,17 +65,11 @@ config_tester = DataTesterConfig(
     # request_bars=True,
     # request_trades=True,
 )
-tester = DataTester(config=config_tester)
-
-node.trader.add_actor(tester)
-
-# Register your client factories with the node
-node.add_data_client_factory(KRAKEN, KrakenLiveDataClientFactory)
-node.build()
 
 
 # Stop and dispose of the node with SIGINT/CTRL+C
 if __name__ == "__main__":
+    node = build_node(config_node, DataTester(config=config_tester))
     try:
         node.run()
     finally:
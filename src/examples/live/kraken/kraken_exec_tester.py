@@ -16,21 +16,13 @@
 
 from decimal import Decimal
 
-from nautilus_trader.adapters.kraken import KRAKEN
-from nautilus_trader.adapters.kraken import KrakenDataClientConfig
+from kraken_common import build_node
+from kraken_common import node_config
+from kraken_common import resolve_instrument_id
+
 from nautilus_trader.adapters.kraken import KrakenEnvironment
-from nautilus_trader.adapters.kraken import KrakenExecClientConfig
-from nautilus_trader.adapters.kraken import KrakenLiveDataClientFactory
-from nautilus_trader.adapters.kraken import KrakenLiveExecClientFactory
 from nautilus_trader.adapters.kraken import KrakenProductType
-from nautilus_trader.config import InstrumentProviderConfig
-from nautilus_trader.config import LiveExecEngineConfig
-from nautilus_trader.config import LoggingConfig
-from nautilus_trader.config import TradingNodeConfig
-from nautilus_trader.live.node import TradingNode
 from nautilus_trader.model.enums import TimeInForce
-from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.test_kit.strategies.tester_exec import ExecTester
 from nautilus_trader.test_kit.strategies.tester_exec import ExecTesterConfig
 
@@ -42,18 +34,25 @@ from nautilus_trader.test_kit.strategies.tester_exec import ExecTesterConfig
 product_type = KrakenProductType.FUTURES  # SPOT or FUTURES
 token = "ETH"
 
-# Symbol and settings based on product type
+# Symbol format per product type
+SYMBOL_FORMATS = {
+    KrakenProductType.SPOT: "{token}/USDT",
+    # Kraken Futures perpetual symbols use PF_ prefix (e.g., PF_XBTUSD, PF_ETHUSD)
+    KrakenProductType.FUTURES: "PF_{token}USD",
+}
+
+instrument_id = resolve_instrument_id(SYMBOL_FORMATS, product_type, token)
+
+# Order parameters (same for spot and futures)
+order_qty = Decimal("0.001")
+
+# Settings based on product type
 if product_type == KrakenProductType.SPOT:
-    symbol = f"{token}/USDT"
-    order_qty = Decimal("0.001")
     enable_sells = False  # May not own base token when starting fresh
     reduce_only_on_stop = False  # Not supported on spot
     use_spot_position_reports = True
     environment = KrakenEnvironment.MAINNET
 elif product_type == KrakenProductType.FUTURES:
-    # Kraken Futures perpetual symbols use PI_ prefix (e.g., PI_XBTUSD, PI_ETHUSD)
-    symbol = f"PF_{token}USD"
-    order_qty = Decimal("0.001")
     enable_sells = True
     reduce_only_on_stop = True
     use_spot_position_reports = False  # Not applicable
@@ -62,65 +61,14 @@ elif product_type == KrakenProductType.FUTURES:
 else:
     raise ValueError(f"Unsupported product type: {product_type}")
 
-instrument_id = InstrumentId.from_str(f"{symbol}.{KRAKEN}")
-product_types = (product_type,)
-
-# Configure the trading node
-config_node = TradingNodeConfig(
-    trader_id=TraderId("TESTER-001"),
-    logging=LoggingConfig(
-        log_level="INFO",
-        # log_level_file="DEBUG",
-        use_pyo3=True,
-    ),
-    exec_engine=LiveExecEngineConfig(
-        reconciliation=True,
-        reconciliation_lookback_mins=1440,
-        open_check_interval_secs=5.0,
-        open_check_open_only=False,
-        position_check_interval_secs=30.0,
-        # snapshot_orders=True,
-        # snapshot_positions=True,
-        # snapshot_positions_interval_secs=5.0,
-        # purge_closed_orders_interval_mins=1,
-        # purge_closed_orders_buffer_mins=0,
-        # purge_closed_positions_interval_mins=1,
-        # purge_closed_positions_buffer_mins=0,
-        # purge_account_events_interval_mins=1,
-        # purge_account_events_lookback_mins=0,
-        # purge_from_database=False,
-        # graceful_shutdown_on_exception=True,
-    ),
-    data_clients={
-        KRAKEN: KrakenDataClientConfig(
-            api_key=None,  # 'KRAKEN_API_KEY' env var
-            api_secret=None,  # 'KRAKEN_API_SECRET' env var
-            environment=environment,
-            product_types=product_types,
-            instrument_provider=InstrumentProviderConfig(load_all=True),
-        ),
-    },
-    exec_clients={
-        KRAKEN: KrakenExecClientConfig(
-            api_key=None,  # 'KRAKEN_API_KEY' env var
-            api_secret=None,  # 'KRAKEN_API_SECRET' env var
-            environment=environment,
-            product_types=product_types,
-            instrument_provider=InstrumentProviderConfig(load_all=True),
-            use_spot_position_reports=use_spot_position_reports,
-            spot_positions_quote_currency="USDT",
-        ),
-    },
-    timeout_connection=30.0,
-    timeout_reconciliation=10.0,
-    timeout_portfolio=10.0,
-    timeout_disconnection=10.0,
-    timeout_post_stop=5.0,
+# Configure the trading node (see kraken_common.py)
+config_node = node_config(
+    environment,
+    product_type,
+    with_exec=True,
+    use_spot_position_reports=use_spot_position_reports,
 )
 
-# Instantiate the node with a configuration
-node = TradingNode(config=config_node)
-
 # Configure your strategy
 strat_config = ExecTesterConfig(
     instrument_id=instrument_id,
@@ -152,20 +100,10 @@ strat_config = ExecTesterConfig(
     log_data=False,
 )
 
-# Instantiate your strategy
-strategy = ExecTester(config=strat_config)
-
-# Add your strategies and modules
-node.trader.add_strategy(strategy)
-
-# Register your client factories with the node
-node.add_data_client_factory(KRAKEN, KrakenLiveDataClientFactory)
-node.add_exec_client_factory(KRAKEN, KrakenLiveExecClientFactory)
-node.build()
-
 
 # Stop and dispose of the node with SIGINT/CTRL+C
 if __name__ == "__main__":
+    node = build_node(config_node, ExecTester(config=strat_config))
     try:
         node.run()
     finally:
@@ -1,11 +1,15 @@
+import heapq
+import itertools
 import sys
 from decimal import Decimal
 
+import pandas as pd
+
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import LoggingConfig
-from nautilus_trader.model import Bar, TraderId
+from nautilus_trader.model import Bar, BarType, TraderId
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
@@ -36,45 +40,59 @@ def run_backtest():
     end_date = "2024-12-31T00:00:00Z"
 
     print("Loading data from catalog...")
-    bars_gld = catalog.query(
-        data_cls=Bar,
-        identifiers=[f"{symbol_name_gld}.{venue_name_abc}"],
-        start=start_date,
-        end=end_date,
-    )
 
-    bars_vti = catalog.query(
-        data_cls=Bar,
-        identifiers=[f"{symbol_name_vti}.{venue_name_abc}"],
-        start=start_date,
-        end=end_date,
-    )
-
-    bars_vti_gld = catalog.query(
-        data_cls=Bar,
-        identifiers=[f"{symbol_name_vti_gld}.{venue_name_abc}"],
-        start=start_date,
-        end=end_date,
-    )
-
-    # Filter bars by timeframe
-    bars_gld_daily = [b for b in bars_gld if "1-DAY" in str(b.bar_type)]
-    bars_gld_weekly = [b for b in bars_gld if "1-WEEK" in str(b.bar_type)]
-    bars_vti_daily = [b for b in bars_vti if "1-DAY" in str(b.bar_type)]
-    bars_vti_weekly = [b for b in bars_vti if "1-WEEK" in str(b.bar_type)]
-
-    bars_vti_gld_daily = [b for b in bars_vti_gld if "1-DAY" in str(b.bar_type)]
-    bars_vti_gld_weekly = [b for b in bars_vti_gld if "1-WEEK" in str(b.bar_type)]
-
-    # Validate data
-    if not (bars_gld_daily and bars_gld_weekly and bars_vti_daily and bars_vti_weekly):
-        print("Error: Missing required data (GLD/VTI Daily or Weekly bars). Check catalog.")
+    def bar_type_for(symbol_name: str, interval: str) -> BarType:
+        return BarType.from_str(f"{symbol_name}.{venue_name_abc}-{interval}-LAST-EXTERNAL")
+
+    bar_gld_daily = bar_type_for(symbol_name_gld, "1-DAY")
+    bar_gld_weekly = bar_type_for(symbol_name_gld, "1-WEEK")
+    bar_vti_daily = bar_type_for(symbol_name_vti, "1-DAY")
+    bar_vti_weekly = bar_type_for(symbol_name_vti, "1-WEEK")
+
+    bar_vti_gld_daily = bar_type_for(symbol_name_vti_gld, "1-DAY")
+    bar_vti_gld_weekly = bar_type_for(symbol_name_vti_gld, "1-WEEK")
+
+    active_bar_types = [
+        bar_gld_daily,
+        bar_vti_daily,
+        bar_gld_weekly,
+        bar_vti_weekly,
+        bar_vti_gld_daily,
+        bar_vti_gld_weekly,
+    ]
+
+    # Validate data: every bar type needs catalog files overlapping the backtest range
+    start_ns = pd.Timestamp(start_date).value
+    end_ns = pd.Timestamp(end_date).value
+
+    def has_bars_in_range(bar_type: BarType) -> bool:
+        return any(
+            first <= end_ns and last >= start_ns
+            for first, last in catalog.get_intervals(Bar, str(bar_type))
+        )
+
+    missing = [str(bar_type) for bar_type in active_bar_types if not has_bars_in_range(bar_type)]
+    if missing:
+        print(f"Error: Missing required data between {start_date} and {end_date} for {missing}. Check catalog.")
         sys.exit(1)
 
-    all_data = bars_gld_daily + bars_vti_daily + bars_gld_weekly + bars_vti_weekly + bars_vti_gld_daily + bars_vti_gld_weekly
-    active_bar_types = list({b.bar_type for b in all_data})
-
-    print(f"Loaded {len(all_data)} bars across {len(active_bar_types)} bar types.")
+    def stream_bars():
+        # Load one year at a time so only a slice of the history is held as Bar objects.
+        # Each series comes back from the catalog sorted by ts_init, so merge them in one
+        # pass into the order the engine replays them.
+        year_starts = pd.date_range(start_date, end_date, freq="YS").asi8
+        bounds = sorted({start_ns, *year_starts, end_ns + 1})
+        for chunk_start, chunk_end in itertools.pairwise(bounds):
+            # Query by concrete bar type so only the matching parquet files are read
+            bar_series = [
+                catalog.bars(bar_types=[str(bar_type)], start=chunk_start, end=chunk_end - 1)
+                for bar_type in active_bar_types
+            ]
+            chunk = list(heapq.merge(*bar_series, key=lambda b: b.ts_init))
+            if chunk:
+                yield chunk
+
+    print(f"Streaming bars for {len(active_bar_types)} bar types.")
 
     # 2. Configure Engine
     engine_config = BacktestEngineConfig(
@@ -100,16 +118,16 @@ def run_backtest():
     engine.add_instrument(instrument_gld)
     engine.add_instrument(instrument_vti)
     engine.add_instrument(instrument_vti_gld)
-    engine.add_data(all_data)
+    engine.add_data_iterator("pair_ratio_bars", stream_bars())
 
     # 4. Register Strategy
     strategy = PairRatioStrategy(
-        bar_a_s=bars_vti_daily[0].bar_type,
-        bar_a_l=bars_vti_weekly[0].bar_type,
-        bar_b_s=bars_gld_daily[0].bar_type,
-        bar_b_l=bars_gld_weekly[0].bar_type,
-        bar_ratio_s=bars_vti_gld_daily[0].bar_type,
-        bar_ratio_l=bars_vti_gld_weekly[0].bar_type,
+        bar_a_s=bar_vti_daily,
+        bar_a_l=bar_vti_weekly,
+        bar_b_s=bar_gld_daily,
+        bar_b_l=bar_gld_weekly,
+        bar_ratio_s=bar_vti_gld_daily,
+        bar_ratio_l=bar_vti_gld_weekly,
         swing_size_r=3,
         swing_size_l=15
     )
@@ -117,7 +135,8 @@ def run_backtest():
 
     # 5. Run
     print("Running backtest...")
-    engine.run()
+    # A streamed run can't infer its range from the data up front, so give it explicitly
+    engine.run(start=start_date, end=end_date)
 
     # 6. Report
     print("Backtest complete.")
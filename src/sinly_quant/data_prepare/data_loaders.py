@@ -1,10 +1,12 @@
 import os
+from pathlib import Path
 from typing import Callable, Optional
 
 import pandas as pd
 from nautilus_trader.model.data import Bar
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.model.data import BarType
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 
 from sinly_quant.data_prepare.instruments_providers import InstrumentProvider
@@ -14,6 +16,46 @@ from sinly_quant.constants import CATALOG_PATH, Venues, Columns
 
 # src/sinly_quant/data_prepare/data_loaders.py
 
+def _tradingview_file_path(symbol_name: str, interval: str) -> Path:
+    return get_absolute_path(__file__, f"data_source/TR_{symbol_name}_{interval}.csv")
+
+
+def _source_file_path(data_provider: str, symbol_name: str, interval: str) -> Path | None:
+    """Return the local source file for file-backed providers, or None."""
+    if data_provider == "tradingview":
+        return _tradingview_file_path(symbol_name, interval)
+    return None
+
+
+def source_mtime_ns(symbol_name: str, interval: str, data_provider: str) -> int | None:
+    """Return the modification time (ns) of a file-backed provider's source file, or None."""
+    source_path = _source_file_path(data_provider, symbol_name, interval)
+    if source_path is None or not source_path.exists():
+        return None
+    return source_path.stat().st_mtime_ns
+
+
+def _stamp_path(symbol_name: str, venue_name: str, interval: str) -> Path:
+    return Path(CATALOG_PATH) / f".{symbol_name}.{venue_name}.{interval}.stamp"
+
+
+def _read_cached_dataframe(
+    catalog: ParquetDataCatalog,
+    symbol_name: str,
+    venue_name: str,
+    interval: str,
+) -> pd.DataFrame | None:
+    """Read previously ingested bars back from the catalog in the provider's DataFrame layout."""
+    bar_type = f"{symbol_name}.{venue_name}-{interval}-LAST-EXTERNAL"
+    df = bars_to_dataframe(catalog.bars(bar_types=[bar_type]))
+    if df.empty:
+        return None
+
+    # Providers return naive timestamps, keep the cached frame aligned with them
+    df.index = df.index.tz_localize(None)
+    return df
+
+
 def prepare_tradingview_data(symbol_name: str, venue_name: str, interval: str) -> dict:
     """Prepare TradingView CSV data into Nautilus Trader bars and metadata.
 
@@ -26,30 +68,44 @@ def prepare_tradingview_data(symbol_name: str, venue_name: str, interval: str) -
         A dict with keys: "venue_name", "instrument", "bar_type", "bars_list".
     """
 
-    file_path = get_absolute_path(__file__, f"data_source/TR_{symbol_name}_{interval}.csv")
+    file_path = _tradingview_file_path(symbol_name, interval)
 
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"TradingView data file not found: {file_path}")
 
-    df = pd.read_csv(file_path)
+    columns = [Columns.TIMESTAMP, Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE, Columns.VOLUME]
+    price_cols = [Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE]
 
     # Handle cases where Volume is missing (5 columns: Time, Open, High, Low, Close)
-    if len(df.columns) == 5:
-        df.columns = [Columns.TIMESTAMP, Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE]
+    # Otherwise assume 6 columns: Time, Open, High, Low, Close, Volume
+    n_columns = len(pd.read_csv(file_path, nrows=0).columns)
+    if n_columns not in (5, 6):
+        raise ValueError(f"Expected 5 or 6 columns in {file_path}, found {n_columns}.")
+
+    # Let the C parser convert the dates while reading. Numbers are inferred (float64 for clean
+    # columns) and coerced below, so a stray non-numeric cell becomes NaN instead of an error.
+    df = pd.read_csv(
+        file_path,
+        header=0,
+        names=columns[:n_columns],
+        parse_dates=[Columns.TIMESTAMP],
+        date_format="%m/%d/%y",
+    )
+    # The columns already come out in order; a missing volume is appended last
+    if n_columns == 5:
         df[Columns.VOLUME] = 0.0
-    else:
-        # Assume 6 columns: Time, Open, High, Low, Close, Volume
-        df.columns = [Columns.TIMESTAMP, Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE, Columns.VOLUME]
 
-    df = df.reindex(columns=[Columns.TIMESTAMP, Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE, Columns.VOLUME])
-    df[Columns.TIMESTAMP] = pd.to_datetime(df[Columns.TIMESTAMP], format="%m/%d/%y")
     df = df.set_index(Columns.TIMESTAMP)
+    # read_csv falls back to strings when a date doesn't match the format instead of raising
+    if not pd.api.types.is_datetime64_dtype(df.index):
+        raise ValueError(f"Could not parse every {Columns.TIMESTAMP} in {file_path} with format %m/%d/%y.")
 
-    # Convert price columns to numeric and round to 4 decimals
-    price_cols = [Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE]
-    df[price_cols] = df[price_cols].apply(pd.to_numeric, errors="coerce").round(4)
+    # Round prices to 4 decimals
+    for col in price_cols:
+        df[col] = pd.to_numeric(df[col], errors="coerce").round(4)
 
-    # Ensure volume is numeric
+    # Volume is parsed as float64 like the prices: the wrangler reads each row as a float64
+    # array, and this matches the frame load_to_catalog returns from the catalog.
     df[Columns.VOLUME] = pd.to_numeric(df[Columns.VOLUME], errors="coerce").fillna(0.0)
 
     instrument = InstrumentProvider.equity(symbol_name, venue_name)
@@ -70,35 +126,49 @@ def prepare_tradingview_data(symbol_name: str, venue_name: str, interval: str) -
     return prepared_data
 
 
+# Data providers by name, each a ``prepare_<provider>_data(symbol_name, venue_name, interval)``
+PROVIDERS: dict[str, Callable[[str, str, str], dict]] = {
+    "tradingview": prepare_tradingview_data,
+}
+
 
 def load_to_catalog(symbol_name: str, venue_name: str, interval: str, data_provider: str) -> Optional[pd.DataFrame]:
     """Prepare data using a named provider and persist it to the Parquet catalog.
 
+    Re-ingesting a file-backed provider whose source file is unchanged (same mtime)
+    reads the bars back from the catalog instead of re-parsing the source.
+
     Args:
         symbol_name: Symbol name, e.g. "GLD".
         venue_name: Venue name, e.g. "NYSE".
         interval: Bar interval string, e.g. "1-DAY".
-        data_provider: A short provider name, e.g. "tradingview" or "yfinance".
-            The function name will be resolved as ``prepare_<data_provider>_data``
-            in this module.
+        data_provider: A short provider name registered in ``PROVIDERS``, e.g. "tradingview".
 
     Returns:
         The DataFrame containing the loaded data, or None if loading failed.
     """
 
-    # Build the function name dynamically, e.g. "tradingview" -> "prepare_tradingview_data"
-    func_name = f"prepare_{data_provider}_data"
+    catalog = ParquetDataCatalog(str(CATALOG_PATH))
 
-    # Look up the function in this module's globals
-    provider_func: Optional[Callable] = globals().get(func_name)
-    if provider_func is None or not callable(provider_func):
-        raise ValueError(f"Data provider function '{func_name}' not found or not callable.")
+    # Skip the provider entirely if its source file hasn't changed since the last ingestion
+    mtime_ns = source_mtime_ns(symbol_name, interval, data_provider)
+    stamp_path = _stamp_path(symbol_name, venue_name, interval)
+    stamp = None
+    if mtime_ns is not None:
+        stamp = f"{data_provider}:{mtime_ns}"
+        if stamp_path.exists() and stamp_path.read_text() == stamp:
+            cached_df = _read_cached_dataframe(catalog, symbol_name, venue_name, interval)
+            if cached_df is not None:
+                return cached_df
+
+    # Resolve the provider function, e.g. "tradingview" -> prepare_tradingview_data
+    provider_func: Optional[Callable[[str, str, str], dict]] = PROVIDERS.get(data_provider)
+    if provider_func is None:
+        raise ValueError(f"Unknown data provider '{data_provider}', expected one of {sorted(PROVIDERS)}.")
 
     # Call the resolved provider function to prepare the data
     prepared_data: dict = provider_func(symbol_name, venue_name, interval)
 
-    catalog = ParquetDataCatalog(str(CATALOG_PATH))
-
     # Write instrument and bars to the catalog
     try:
         catalog.write_data([prepared_data["instrument"]])
@@ -106,18 +176,13 @@ def load_to_catalog(symbol_name: str, venue_name: str, interval: str, data_provi
     except ValueError as e:
         raise RuntimeError(f"Failed to write data to catalog: {e}")
 
-    return prepared_data.get("dataframe")
+    if stamp is not None:
+        stamp_path.write_text(stamp)
 
+    return prepared_data.get("dataframe")
 
-def save_synthetic_to_catalog(ratio_name: str, df: pd.DataFrame, interval: str) -> None:
-    """
-    Save synthetic ratio data to catalog.
 
-    Args:
-        ratio_name: Name of the ratio, e.g. "vti:gld_1-DAY".
-        df: DataFrame containing OHLC data.
-        interval: Bar interval string, e.g. "1-DAY".
-    """
+def _synthetic_symbol(ratio_name: str) -> str:
     # Parse ratio_name to extract symbol and interval
     # Assuming format "symbol_interval" or just "symbol"
     if "_" in ratio_name:
@@ -125,29 +190,55 @@ def save_synthetic_to_catalog(ratio_name: str, df: pd.DataFrame, interval: str)
     else:
         symbol_str = ratio_name
 
-    symbol_name = symbol_str.upper()
-    venue_name = Venues.SYNTH
+    return symbol_str.upper()
 
-    instrument = InstrumentProvider.equity(symbol_name, venue_name)
+
+def synthetic_bar_type(ratio_name: str, interval: str) -> BarType:
+    """Return the BarType a ratio's synthetic bars are saved under, e.g. "VTI_GLD.SYNTH-1-DAY-LAST-EXTERNAL"."""
+    return BarType.from_str(f"{_synthetic_symbol(ratio_name)}.{Venues.SYNTH}-{interval}-LAST-EXTERNAL")
+
+
+def build_synthetic_bars(ratio_name: str, df: pd.DataFrame, interval: str) -> tuple[Instrument, list[Bar]]:
+    """
+    Build the synthetic instrument and its bars for a ratio, without writing them.
+
+    Args:
+        ratio_name: Name of the ratio, e.g. "vti:gld_1-DAY".
+        df: DataFrame containing OHLC data.
+        interval: Bar interval string, e.g. "1-DAY".
+
+    Returns:
+        The synthetic instrument and its bars.
+    """
+    instrument = InstrumentProvider.equity(_synthetic_symbol(ratio_name), Venues.SYNTH)
 
     # Ensure volume column exists
     if Columns.VOLUME not in df.columns:
         df = df.copy()
         df[Columns.VOLUME] = 0.0
 
-    # Define BarType
-    bar_type = BarType.from_str(f"{instrument.id}-{interval}-LAST-EXTERNAL")
-
     # Process DataFrame into Bars
-    wrangler = BarDataWrangler(bar_type, instrument)
-    bars_list = wrangler.process(df)
+    wrangler = BarDataWrangler(synthetic_bar_type(ratio_name, interval), instrument)
+    return instrument, wrangler.process(df)
+
+
+def save_synthetic_to_catalog(synthetic_bars: list[tuple[Instrument, list[Bar]]]) -> None:
+    """
+    Save synthetic instruments and bars to catalog in one write each.
+
+    Args:
+        synthetic_bars: (instrument, bars) pairs as returned by build_synthetic_bars.
+    """
+    # Ratios at several intervals share one instrument, so only write it once
+    instruments = list({instrument.id: instrument for instrument, _ in synthetic_bars}.values())
+    bars = [bar for _, ratio_bars in synthetic_bars for bar in ratio_bars]
 
     # Write to catalog
     catalog = ParquetDataCatalog(str(CATALOG_PATH))
 
     try:
-        catalog.write_data([instrument])
-        catalog.write_data(bars_list)
+        catalog.write_data(instruments)
+        catalog.write_data(bars)
     except ValueError as e:
         raise RuntimeError(f"Failed to write synthetic data to catalog: {e}")
 
@@ -206,13 +297,13 @@ def query_from_catalog(
     start_ns = pd.Timestamp(start_datetime).value if start_datetime else None
     end_ns = pd.Timestamp(end_datetime).value if end_datetime else None
 
-    # catalog.bars returns a generator of Bar objects
-    bars_generator = catalog.bars(bar_types=[str(target_bar_type)], start=start_ns, end=end_ns)
+    # The time range is applied by the catalog query itself, so files outside it aren't read
+    bars = catalog.bars(bar_types=[str(target_bar_type)], start=start_ns, end=end_ns)
 
     if not as_dataframe:
-        return list(bars_generator)
+        return bars
 
     # 4. Convert to DataFrame
-    return bars_to_dataframe(bars_generator)
+    return bars_to_dataframe(bars)
 
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, List
 from sinly_quant.sinly_logger import get_logger
@@ -5,6 +6,37 @@ from sinly_quant.constants import Columns
 
 logger = get_logger(__name__)
 
+OHLC_COLS: list[str] = [Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE]
+
+
+def _ratio_ohlc(df_a: pd.DataFrame, df_b: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculates the A / B ratio OHLC on the timestamps both inputs share.
+    """
+    # Align data on Timestamps
+    # We intersect the indexes to ensure we only calculate the ratio
+    # when BOTH instruments have a bar at that specific time.
+    index = df_a.index.intersection(df_b.index)
+
+    # Work on the two aligned (N, 4) OHLC blocks directly rather than merging them
+    # into a suffixed 8-column frame first.
+    a = df_a.loc[index, OHLC_COLS].to_numpy(dtype=np.float64)
+    b = df_b.loc[index, OHLC_COLS].to_numpy(dtype=np.float64)
+    ratio = np.empty_like(a)
+
+    # Open and Close are straightforward ratios
+    np.divide(a[:, 0], b[:, 0], out=ratio[:, 0])
+
+    # High of a ratio is maximized when numerator is highest and denominator is lowest
+    np.divide(a[:, 1], b[:, 2], out=ratio[:, 1])
+
+    # Low of a ratio is minimized when numerator is lowest and denominator is highest
+    np.divide(a[:, 2], b[:, 1], out=ratio[:, 2])
+
+    np.divide(a[:, 3], b[:, 3], out=ratio[:, 3])
+
+    return pd.DataFrame(ratio, index=index, columns=OHLC_COLS)
+
 
 def calculate_ratios_from_profiles(
     market_data: Dict[str, pd.DataFrame],
@@ -31,7 +63,7 @@ def calculate_ratios_from_profiles(
         # Generate ratio name based on instrument IDs
         ratio_base_name = f"{id_a}_{id_b}"
         # Use a unique key for the results dict to handle multiple intervals for the same pair
-        # This also helps save_synthetic_to_catalog extract the correct symbol (everything before the last underscore)
+        # This also helps build_synthetic_bars extract the correct symbol (everything before the last underscore)
         ratio_name = f"{ratio_base_name}_{interval}"
 
         # Construct potential keys for lookup.
@@ -65,46 +97,21 @@ def calculate_ratios_from_profiles(
             logger.warning(f"Missing data for {id_b} (tried keys: {keys_b}). Skipping {ratio_name}.")
             continue
 
-        # 2. Align data on Timestamps
-        # We use an inner join to ensure we only calculate the ratio
-        # when BOTH instruments have a bar at that specific time.
-        cols_to_merge: list[str] = [Columns.OPEN, Columns.HIGH, Columns.LOW, Columns.CLOSE]
-
-        # Check if required columns exist
-        missing_cols_a = [c for c in cols_to_merge if c not in df_a.columns]
-        missing_cols_b = [c for c in cols_to_merge if c not in df_b.columns]
+        # 2. Check if required columns exist
+        missing_cols_a = [c for c in OHLC_COLS if c not in df_a.columns]
+        missing_cols_b = [c for c in OHLC_COLS if c not in df_b.columns]
 
         if missing_cols_a or missing_cols_b:
             logger.warning(f"Missing OHLC columns for {ratio_name}. A missing: {missing_cols_a}, B missing: {missing_cols_b}. Skipping.")
             continue
 
-        aligned = pd.merge(
-            df_a[cols_to_merge],
-            df_b[cols_to_merge],
-            left_index=True,
-            right_index=True,
-            suffixes=('_a', '_b')
-        )
+        # 3. Calculate Ratio (A / B)
+        ratio_df = _ratio_ohlc(df_a, df_b)
 
-        if aligned.empty:
+        if ratio_df.empty:
             logger.warning(f"No overlapping data found for {ratio_name} between {id_a} and {id_b}.")
             continue
 
-        # 3. Calculate Ratio (A / B)
-        # Calculate ratios for open, high, low, close
-        ratio_df = pd.DataFrame(index=aligned.index)
-
-        # Open and Close are straightforward ratios
-        ratio_df[Columns.OPEN] = aligned[f'{Columns.OPEN}_a'] / aligned[f'{Columns.OPEN}_b']
-
-        # High of a ratio is maximized when numerator is highest and denominator is lowest
-        ratio_df[Columns.HIGH] = aligned[f'{Columns.HIGH}_a'] / aligned[f'{Columns.LOW}_b']
-
-        # Low of a ratio is minimized when numerator is lowest and denominator is highest
-        ratio_df[Columns.LOW] = aligned[f'{Columns.LOW}_a'] / aligned[f'{Columns.HIGH}_b']
-
-        ratio_df[Columns.CLOSE] = aligned[f'{Columns.CLOSE}_a'] / aligned[f'{Columns.CLOSE}_b']
-
         # Optional: Forward fill if you want to handle slight data gaps differently
         # ratio_df = ratio_df.ffill()
         results[ratio_name] = {
@@ -1,12 +1,27 @@
+import hashlib
+import json
+from pathlib import Path
+
 import pandas as pd
 import os
-from sinly_quant.data_prepare.data_loaders import load_to_catalog, save_synthetic_to_catalog
+from nautilus_trader.model.data import Bar
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from sinly_quant.constants import CATALOG_PATH
+from sinly_quant.data_prepare.data_loaders import (
+    build_synthetic_bars,
+    load_to_catalog,
+    save_synthetic_to_catalog,
+    source_mtime_ns,
+    synthetic_bar_type,
+)
 from sinly_quant.data_prepare.ratio_calculator import calculate_ratios_from_profiles
 from sinly_quant.sinly_logger import get_logger
 from sinly_quant.util import get_absolute_path
 
 logger = get_logger(__name__)
 
+RATIO_CACHE_FILE = ".ratio_cache.json"
+
 
 def load_config_from_csv(file_path: str) -> list[dict]:
     """Generic loader for universe or ratio configs."""
@@ -18,6 +33,20 @@ def load_config_from_csv(file_path: str) -> list[dict]:
     return pd.read_csv(file_path).to_dict(orient="records")
 
 
+def _ratio_cache_key(profile: dict, source_mtimes: dict[str, int]) -> str | None:
+    """Hash of a ratio's inputs, or None if either input has no source file to compare."""
+    id_a = profile.get("instrument_id_a")
+    id_b = profile.get("instrument_id_b")
+    interval = profile.get("interval", "1-DAY")
+    mtime_a = source_mtimes.get(id_a)
+    mtime_b = source_mtimes.get(id_b)
+    if mtime_a is None or mtime_b is None:
+        return None
+
+    key = f"{id_a}|{id_b}|{interval}|{mtime_a}|{mtime_b}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
 def main():
     # 1. Configuration for raw instruments
     universe_path = get_absolute_path(__file__, "universe.csv")
@@ -30,6 +59,8 @@ def main():
     # Dictionary to hold DataFrames for the ratio calculator
     # key: symbol (e.g., 'VTI'), value: DataFrame
     market_data_cache = {}
+    # key: symbol, value: source file mtime (ns) for file-backed providers
+    source_mtimes = {}
 
     logger.info(f"Starting ingestion for {len(instruments_config)} instruments...")
 
@@ -52,6 +83,9 @@ def main():
             # If load_to_catalog doesn't return a DF, you must read it back from disk here.
             if isinstance(df, pd.DataFrame):
                 market_data_cache[config["symbol"]] = df
+                mtime_ns = source_mtime_ns(config["symbol"], config["interval"], config["provider"])
+                if mtime_ns is not None:
+                    source_mtimes[config["symbol"]] = mtime_ns
 
             logger.info(f"Successfully loaded {config['symbol']}.")
         except Exception as e:
@@ -70,23 +104,66 @@ def main():
         logger.warning("No ratio profiles found.")
         return
 
-    synthetic_ratios = calculate_ratios_from_profiles(market_data_cache, ratio_profiles)
+    # Skip ratios whose inputs haven't changed since they were last saved
+    ratio_cache_path = Path(CATALOG_PATH) / RATIO_CACHE_FILE
+    ratio_cache = json.loads(ratio_cache_path.read_text()) if ratio_cache_path.exists() else {}
+    catalog = ParquetDataCatalog(str(CATALOG_PATH))
+    pending_profiles = []
+    pending_keys = {}
+    for profile in ratio_profiles:
+        ratio_name = (
+            f"{profile.get('instrument_id_a')}_{profile.get('instrument_id_b')}"
+            f"_{profile.get('interval', '1-DAY')}"
+        )
+        cache_key = _ratio_cache_key(profile, source_mtimes)
+        if cache_key is not None and ratio_cache.get(ratio_name) == cache_key:
+            # Only trust the cache entry while the saved bars are still in the catalog
+            bar_type = synthetic_bar_type(ratio_name, profile.get("interval", "1-DAY"))
+            if catalog.get_intervals(Bar, str(bar_type)):
+                logger.info(f"{ratio_name} is up to date, skipping.")
+                continue
+            ratio_cache.pop(ratio_name)
+        pending_profiles.append(profile)
+        pending_keys[ratio_name] = cache_key
+
+    if not pending_profiles:
+        logger.info("All ratios are up to date.")
+        return
+
+    synthetic_ratios = calculate_ratios_from_profiles(market_data_cache, pending_profiles)
 
     # 4. Save Ratios to Catalog
+    synthetic_bars = []
+    built_ratios = []
     for ratio_name, result in synthetic_ratios.items():
         try:
-            logger.info(f"Saving synthetic instrument: {ratio_name}...")
+            logger.info(f"Building synthetic instrument: {ratio_name}...")
 
             ratio_df = result["df"]
             interval = result["interval"]
 
-            save_synthetic_to_catalog(ratio_name, ratio_df, interval)
+            synthetic_bars.append(build_synthetic_bars(ratio_name, ratio_df, interval))
+            built_ratios.append(ratio_name)
 
             # For now, just printing the head to verify flow
             logger.debug(f"Tail of {ratio_name}:\n{ratio_df.tail()}")
 
         except Exception as e:
-            logger.error(f"Failed to save ratio {ratio_name}: {e}")
+            logger.error(f"Failed to build ratio {ratio_name}: {e}")
+
+    # One catalog write for all ratios instead of one per ratio
+    if synthetic_bars:
+        try:
+            logger.info(f"Saving {len(synthetic_bars)} synthetic ratios...")
+            save_synthetic_to_catalog(synthetic_bars)
+            for ratio_name in built_ratios:
+                if pending_keys.get(ratio_name) is not None:
+                    ratio_cache[ratio_name] = pending_keys[ratio_name]
+        except Exception as e:
+            logger.error(f"Failed to save synthetic ratios: {e}")
+
+    ratio_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    ratio_cache_path.write_text(json.dumps(ratio_cache, indent=2))
 
     logger.info("Ingestion and processing complete.")
 
@@ -55,6 +55,7 @@ class PyExponentialMovingAverage(Indicator):
         self.period = period
         self.price_type = price_type
         self.alpha = 2.0 / (period + 1.0)
+        self._decay = 1.0 - self.alpha
         self.value = 0.0  # <-- stateful value
         self.count = 0  # <-- stateful value
 
@@ -85,11 +86,19 @@ class PyExponentialMovingAverage(Indicator):
             The update value.
 
         """
+        # Once warmed up only the recurrence is left, so skip the state checks below
+        if self.initialized:
+            ema = self.alpha * value + self._decay * self.value
+            self.value = ema
+            self.count += 1
+            self.values.append(ema)
+            return
+
         # Check if this is the initial input
         if not self.has_inputs:
             self.value = value
 
-        self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
+        self.value = self.alpha * value + self._decay * self.value
         self.count += 1
 
         self.values.append(self.value)
@@ -1,19 +1,41 @@
 from collections import deque
 from typing import Optional
 
+import numpy as np
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.indicators import Indicator
 from nautilus_trader.model.data import Bar
 
 
+def _push_max(window: deque, index: int, value: float, oldest: int) -> None:
+    # Monotonic deque of (index, value) with decreasing values: the front is the window max
+    while window and window[-1][1] <= value:
+        window.pop()
+    window.append((index, value))
+    # The window advances one bar per push, so at most one entry expires
+    if window[0][0] < oldest:
+        window.popleft()
+
+
+def _push_min(window: deque, index: int, value: float, oldest: int) -> None:
+    # Monotonic deque of (index, value) with increasing values: the front is the window min
+    while window and window[-1][1] >= value:
+        window.pop()
+    window.append((index, value))
+    if window[0][0] < oldest:
+        window.popleft()
+
+
 class SwingLevels(Indicator):
 
-    def __init__(self, swing_size_r: int, swing_size_l: int):
+    def __init__(self, swing_size_r: int, swing_size_l: int, history_size: int | None = None):
 
         super().__init__(params=[swing_size_r, swing_size_l])
 
         PyCondition.positive_int(swing_size_r, "Swing Size Right")
         PyCondition.positive_int(swing_size_l, "Swing Size Left")
+        if history_size is not None:
+            PyCondition.positive_int(history_size, "History Size")
 
 
         self.swing_size_r = swing_size_r
@@ -23,17 +45,33 @@ class SwingLevels(Indicator):
         # [ left bars ... candidate ... right bars ]
         self._window_size = swing_size_l + swing_size_r + 1
 
-        # Deques to store the sliding window of prices
-        self._highs = deque(maxlen=self._window_size)
-        self._lows = deque(maxlen=self._window_size)
-        self._bars = deque(maxlen=self._window_size)
+        # The candidate sits 'swing_size_r' bars before the newest one, i.e. this many
+        # slots before the ring write cursor (negative indexes wrap to the buffer end)
+        self._candidate_offset = -swing_size_r - 1
+
+        # Ring buffers to store the sliding window of prices.
+        # `_pos` is the next slot to write, which (once full) is also the oldest bar.
+        self._highs = np.empty(self._window_size, dtype=np.float64)
+        self._lows = np.empty(self._window_size, dtype=np.float64)
+        self._bars: list[Bar | None] = [None] * self._window_size
+        self._pos = 0
+
+        # Sliding window extrema, updated in amortized O(1) per bar.
+        # `_index` counts every bar seen and keys the entries so they can expire.
+        self._index = 0
+        self._high_max: deque[tuple[int, float]] = deque()
+        self._high_min: deque[tuple[int, float]] = deque()
+        self._low_min: deque[tuple[int, float]] = deque()
+        self._low_max: deque[tuple[int, float]] = deque()
 
         # Outputs: These will hold the price if a pivot is confirmed on the current bar
         self.pivot_high: Optional[float] = None
         self.pivot_low: Optional[float] = None
 
-        self.pivot_high_history: list[Bar] = []
-        self.pivot_low_history: list[Bar] = []
+        # Confirmed pivot bars. With `history_size` only the most recent pivots are kept,
+        # so long backtests don't hold on to every pivot bar.
+        self.pivot_high_history: list[Bar] | deque[Bar] = deque(maxlen=history_size) if history_size else []
+        self.pivot_low_history: list[Bar] | deque[Bar] = deque(maxlen=history_size) if history_size else []
 
 
     def handle_bar(self, bar: Bar):
@@ -42,43 +80,54 @@ class SwingLevels(Indicator):
         """
         PyCondition.not_none(bar, "bar")
 
-        # pd.Timestamp(bar.ts_event, unit="ns", tz="UTC") == pd.Timestamp('2025-11-03 00:00:00+0000', tz='UTC')
-        import pandas as pd
         # 1. Update buffers with new bar data
-        self._highs.append(bar.high.as_double())
-        self._lows.append(bar.low.as_double())
-        self._bars.append(bar)
+        high = bar.high.as_double()
+        low = bar.low.as_double()
+        pos = self._pos
+        self._highs[pos] = high
+        self._lows[pos] = low
+        self._bars[pos] = bar
+        self._pos = (pos + 1) % self._window_size
+
+        index = self._index
+        self._index = index + 1
+        oldest = index - self._window_size + 1
+        _push_max(self._high_max, index, high, oldest)
+        _push_min(self._high_min, index, high, oldest)
+        _push_min(self._low_min, index, low, oldest)
+        _push_max(self._low_max, index, low, oldest)
 
         # 2. Reset outputs for the current step
         self.pivot_high = None
         self.pivot_low = None
 
         # 3. Check if we have enough data to make a decision
-        if len(self._highs) < self._window_size:
+        if oldest < 0:
             return
 
         # 4. Identify the candidate value
         # The candidate is the bar that occurred 'swing_size_r' bars ago.
-        # In our window of size (L + 1 + R), this is at index 'swing_size_l'.
-        candidate_idx = self.swing_size_l
+        # In our window of size (L + 1 + R), this is 'swing_size_l' slots after the oldest bar.
+        candidate_idx = self._pos + self._candidate_offset
+        candidate_bar = self._bars[candidate_idx]
 
         # 5. Check for Pivot High
         # Logic: Candidate must be the maximum in the window
         candidate_high = self._highs[candidate_idx]
-        if candidate_high == max(self._highs):
+        if candidate_high == self._high_max[0][1]:
             # Pine Script nuance: strictly greater than at least one other bar
             # to avoid marking every bar as a pivot in a flat line
-            if candidate_high > min(self._highs):
-                self.pivot_high = candidate_high
-                self.pivot_high_history.append(self._bars[-self.swing_size_r-1])
+            if candidate_high > self._high_min[0][1]:
+                self.pivot_high = float(candidate_high)
+                self.pivot_high_history.append(candidate_bar)
 
         # 6. Check for Pivot Low
         # Logic: Candidate must be the minimum in the window
         candidate_low = self._lows[candidate_idx]
-        if candidate_low == min(self._lows):
-            if candidate_low < max(self._lows):
-                self.pivot_low = candidate_low
-                self.pivot_low_history.append(self._bars[-self.swing_size_r-1])
+        if candidate_low == self._low_min[0][1]:
+            if candidate_low < self._low_max[0][1]:
+                self.pivot_low = float(candidate_low)
+                self.pivot_low_history.append(candidate_bar)
 
         # 7. Update Indicator state
         self._set_has_inputs(True)
@@ -17,21 +17,107 @@ if you want to override defaults (log level, path, etc.).
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import os
+import queue
+import time
 from pathlib import Path
 from typing import Optional
 
 from .constants import CATALOG_PATH
 
+
 # Default log directory under the project root. We reuse CATALOG_PATH's
 # parent as an anchor to avoid guessing the installation location.
-PROJECT_ROOT = Path(CATALOG_PATH).resolve().parents[1]
-LOG_DIR = PROJECT_ROOT / "logs"
-LOG_FILE = LOG_DIR / "project.log"
+# Computed on first use rather than at import. abspath only normalizes the string
+# (no stat calls like resolve()), which is all an absolute CATALOG_PATH needs.
+@functools.cache
+def _project_root() -> Path:
+    return Path(os.path.dirname(os.path.dirname(os.path.abspath(CATALOG_PATH))))
+
+
+def _log_dir() -> Path:
+    return _project_root() / "logs"
+
+
+def _log_file() -> Path:
+    return _log_dir() / "project.log"
+
+
+_LAZY_PATHS = {"PROJECT_ROOT": _project_root, "LOG_DIR": _log_dir, "LOG_FILE": _log_file}
+
 
+def __getattr__(name: str) -> Path:
+    # Keeps PROJECT_ROOT, LOG_DIR and LOG_FILE importable as module attributes
+    if name in _LAZY_PATHS:
+        return _LAZY_PATHS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def setup_logging(level: int = logging.INFO, log_to_file: bool = True) -> None:
+
+# Shared by the console and file handlers
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that flushes after a batch of records instead of after every one.
+
+    The stream is flushed every ``flush_every`` records, or on the first record after
+    ``flush_interval`` seconds. Closing or rolling over the file writes out whatever is
+    still buffered, and explicit ``flush()`` calls always flush. Rollover is checked
+    without flushing, so a rotated file may exceed ``maxBytes`` by up to one text chunk.
+    """
+
+    def __init__(self, *args, flush_every: int = 64, flush_interval: float = 1.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._emitting = False
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # Same check as the base class, but the text stream's tell() flushes it on every
+        # record. The binary buffer's position doesn't, and lags by at most one text chunk.
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            pos = self.stream.buffer.tell()
+            if not pos:
+                return False
+            msg = f"{self.format(record)}\n"
+            if pos + len(msg) >= self.maxBytes:
+                # Only rotate regular files (not e.g. /dev/null)
+                return os.path.isfile(self.baseFilename)
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._emitting = True
+        try:
+            super().emit(record)
+        finally:
+            self._emitting = False
+
+    def flush(self) -> None:
+        # StreamHandler.emit flushes after every record; batch those flushes
+        if self._emitting:
+            self._pending += 1
+            if (
+                self._pending < self._flush_every
+                and time.monotonic() - self._last_flush < self._flush_interval
+            ):
+                return
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+
+def setup_logging(level: int = logging.INFO, log_to_file: bool = True, fast_records: bool = False) -> None:
     """Configure root logging for the project.
 
     This is idempotent and safe to call multiple times; subsequent calls
@@ -40,6 +126,14 @@ def setup_logging(level: int = logging.INFO, log_to_file: bool = True) -> None:
     Args:
         level: Logging level for the root logger (e.g. ``logging.INFO``).
         log_to_file: Whether to also log to a rotating file under ``logs/``.
+        fast_records: Stop collecting caller, thread, process and task info for
+            every record. This is process-wide: it also blanks fields such as
+            ``%(lineno)s``, ``%(funcName)s`` and ``%(thread)s`` for every other
+            logger, so only applications that own their logging should enable it.
+
+    The console and file handlers run on a background
+    :class:`~logging.handlers.QueueListener` thread, so a log call on the
+    caller's thread only enqueues the record.
     """
 
     root = logging.getLogger()
@@ -48,28 +142,44 @@ def setup_logging(level: int = logging.INFO, log_to_file: bool = True) -> None:
 
     root.setLevel(level)
 
+    if fast_records:
+        # The project format only uses time, level, name and message, so skip collecting
+        # caller, thread, process and task info for every record (the knobs listed under
+        # "Optimization" in the logging docs)
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_fmt = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(console_fmt)
-    root.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
+    handlers: list[logging.Handler] = [console_handler]
 
     # Optional file handler
     if log_to_file:
-        LOG_DIR.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
-            LOG_FILE,
+        _log_dir().mkdir(parents=True, exist_ok=True)
+        file_handler = _BufferedRotatingFileHandler(
+            _log_file(),
             maxBytes=5 * 1024 * 1024,  # 5 MB
             backupCount=3,
             encoding="utf-8",
+            delay=True,  # Open the file on the first record, not at setup
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(console_fmt)
-        root.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+
+    # Root only enqueues; the listener thread does the formatting and I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drain anything still queued when the interpreter exits
+    atexit.register(listener.stop)
+    root._sinly_quant_queue_listener = listener  # type: ignore[attr-defined]
 
     # Mark as configured to avoid double configuration
     root._sinly_quant_logging_configured = True  # type: ignore[attr-defined]
@@ -95,5 +205,6 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
-__all__ = ["get_logger", "setup_logging", "LOG_DIR", "LOG_FILE"]
+# PROJECT_ROOT, LOG_DIR and LOG_FILE are resolved lazily by __getattr__ and imported by name
+__all__ = ["get_logger", "setup_logging"]
 
@@ -1,27 +1,61 @@
 from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.model.identifiers import InstrumentId, Venue
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events import OrderFilled
+import numpy as np
 import pandas as pd
 
+from sinly_quant.util import unix_ns_to_str
+
+FILL_COLUMNS = (
+    'ts_event',
+    'instrument_id',
+    'order_side',
+    'fill_qty',
+    'fill_px',
+    'fill_value',
+    'position_qty',
+    'available_cash',
+    'client_order_id',
+)
+
+# fills_df category labels, indexed by OrderSide value
+_ORDER_SIDE_NAMES = [side.name for side in sorted(OrderSide, key=int)]
+
 
 class BaseSinlyStrategy(Strategy):
     """
     A base class for Sinly Quant strategies containing shared utilities.
     """
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, expected_fills: int = 0):
         super().__init__(config)
-        self.fills_history = []
+        # Fills history stored column-wise, one list per field. The lists are preallocated
+        # to `expected_fills` rows and filled through a cursor, then appended to past that.
+        self._fills = {name: [None] * expected_fills for name in FILL_COLUMNS}
+        self._fill_count = 0
+        # Accounts are updated in place by the portfolio, so the object can be reused per venue
+        self._account_cache = {}
 
     def get_available_cash(self, venue: Venue) -> float:
 
-        account = self.cache.account_for_venue(venue)
+        account = self._account_cache.get(venue)
         if account is None:
-            self.log.error(f"Account for venue {venue} not found.")
-            return 0.0
+            account = self.cache.account_for_venue(venue)
+            if account is None:
+                self.log.error(f"Account for venue {venue} not found.")
+                return 0.0
+            self._account_cache[venue] = account
         return account.balance_free().as_double()
         # return account.balance_total(currency).as_double()
 
+    def on_reset(self) -> None:
+        # A reset engine rebuilds its accounts, so drop the ones cached from the previous run
+        self._account_cache.clear()
+
+    def on_dispose(self) -> None:
+        self._account_cache.clear()
+
     def get_quote_qty(self, instrument_id: InstrumentId) -> float:
         """
         Retrieves the quantity currently held for the specified instrument.
@@ -44,18 +78,21 @@ class BaseSinlyStrategy(Strategy):
             self.log.info(f"No positions found for {instrument_id}")
             return
 
-        self.log.info(f"--- Debug Positions for {instrument_id} ---")
+        # Nautilus' logger can't report whether INFO is enabled, so build the dump once
+        # and hand it over in a single call rather than one call per event
+        lines = [f"--- Debug Positions for {instrument_id} ---"]
         for i, pos in enumerate(positions):
-            self.log.info(f"Position #{i}: {pos}")
+            lines.append(f"Position #{i}: {pos}")
             if hasattr(pos, 'events'):
                 for event in pos.events:
-                    ts_readable = pd.Timestamp(event.ts_event, unit='ns')
-                    self.log.info(f"  Event Time: {ts_readable} | Type: {type(event).__name__} | Details: {event}")
-        self.log.info("-------------------------------------------")
+                    ts_readable = unix_ns_to_str(event.ts_event)
+                    lines.append(f"  Event Time: {ts_readable} | Type: {type(event).__name__} | Details: {event}")
+        lines.append("-------------------------------------------")
+        self.log.info("\n".join(lines))
 
     def record_fill(self, event: OrderFilled):
         """
-        Records the details of a fill event into the strategy's fills history list.
+        Records the details of a fill event into the strategy's fills history.
         """
         fill_px = event.last_px.as_double()
         fill_qty = event.last_qty.as_double()
@@ -69,22 +106,49 @@ class BaseSinlyStrategy(Strategy):
         current_cash = self.get_available_cash(event.instrument_id.venue)
 
         # 4. Append to history (minimal version, subclass can enrich)
-        record = {
-            'ts_event': pd.Timestamp(event.ts_event, unit='ns'),
-            'instrument_id': event.instrument_id.value,
-            'order_side': str(event.order_side),
-            'fill_qty': fill_qty,
-            'fill_px': fill_px,
-            'fill_value': fill_value,
-            'position_qty': current_pos_qty,
-            'available_cash': current_cash,
-            'client_order_id': event.client_order_id.value
-        }
-        self.fills_history.append(record)
+        #    Timestamps and order sides stay as ints here and are converted in bulk by fills_df
+        row = (
+            event.ts_event,
+            event.instrument_id.value,
+            int(event.order_side),
+            fill_qty,
+            fill_px,
+            fill_value,
+            current_pos_qty,
+            current_cash,
+            event.client_order_id.value,
+        )
+        self._append_fill(row)
+
+    def _append_fill(self, row: tuple):
+        i = self._fill_count
+        fills = self._fills
+        if i < len(fills['ts_event']):
+            for name, value in zip(FILL_COLUMNS, row, strict=True):
+                fills[name][i] = value
+        else:
+            for name, value in zip(FILL_COLUMNS, row, strict=True):
+                fills[name].append(value)
+        self._fill_count = i + 1
 
     @property
     def fills_df(self) -> pd.DataFrame:
         """
         Returns the fills history as a pandas DataFrame.
         """
-        return pd.DataFrame(self.fills_history)
+        n = self._fill_count
+        fills = {name: column[:n] for name, column in self._fills.items()}
+        # Numeric columns go in as typed arrays so pandas doesn't infer dtypes from Python objects
+        return pd.DataFrame({
+            'ts_event': pd.to_datetime(np.asarray(fills['ts_event'], dtype='int64'), unit='ns'),
+            'instrument_id': np.asarray(fills['instrument_id'], dtype=object),
+            'order_side': pd.Categorical.from_codes(
+                np.asarray(fills['order_side'], dtype=np.int8), categories=_ORDER_SIDE_NAMES
+            ),
+            'fill_qty': np.asarray(fills['fill_qty'], dtype='float64'),
+            'fill_px': np.asarray(fills['fill_px'], dtype='float64'),
+            'fill_value': np.asarray(fills['fill_value'], dtype='float64'),
+            'position_qty': np.asarray(fills['position_qty'], dtype='float64'),
+            'available_cash': np.asarray(fills['available_cash'], dtype='float64'),
+            'client_order_id': np.asarray(fills['client_order_id'], dtype=object),
+        })
@@ -14,54 +14,85 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime as dt
-import pandas as pd
 
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.events import PositionChanged
 from nautilus_trader.model.events import PositionOpened
 from nautilus_trader.model.events import PositionClosed
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.trading.strategy import Strategy
 from sinly_quant.my_indicators.my_ema_python import PyExponentialMovingAverage
+from sinly_quant.util import unix_ns_to_str
 
 from typing import List, Dict
 
 
+class _BarState:
+    """Indicators and previous EMA values for one BarType."""
+
+    __slots__ = ('ema10', 'ema20', 'prev_ema10', 'prev_ema20', 'warm')
+
+    def __init__(self):
+        self.ema10 = PyExponentialMovingAverage(10)
+        self.ema20 = PyExponentialMovingAverage(20)
+        self.prev_ema10 = None
+        self.prev_ema20 = None
+        # Set once both EMAs are initialized; they never become uninitialized again
+        self.warm = False
+
+
 class DemoStrategy(Strategy):
-    def __init__(self, bar_types: List[BarType], quantity: int = 10):
+    """EMA(10)/EMA(20) crossover on each bar type, long only.
+
+    Position sides are tracked per instrument from position events, so the venue must use a
+    NETTING OMS (one position per instrument).
+    """
+
+    def __init__(self, bar_types: List[BarType], quantity: int = 10, log_events: bool = True):
         super().__init__()
 
         self.bar_types = bar_types
         self.quantity = quantity
+        # Several bar types can share an instrument; positions are closed once per instrument
+        # (dict.fromkeys rather than a set keeps bar_types order, so stop-time orders are deterministic)
+        self._unique_instruments = tuple(dict.fromkeys(bar_type.instrument_id for bar_type in bar_types))
+
+        # Nautilus filters log levels after the message is built, so per-signal/event
+        # messages are gated here to skip formatting them when they aren't wanted
+        self._log_events = log_events
+
+        # Instruments looked up once at start instead of on every signal
+        self._instruments = {}
+        # Side of each open position, kept from position events so signals don't query the portfolio
+        self._position_sides: Dict[InstrumentId, PositionSide] = {}
 
         # Dictionary to hold state and indicators per BarType
-        # Key: BarType, Value: Dict with indicators and previous values
+        # Key: BarType, Value: _BarState with indicators and previous values
         # Renamed from self.state to self.indicators_state to avoid conflict with Component.state
-        self.indicators_state: Dict[BarType, dict] = {}
+        self.indicators_state: Dict[BarType, _BarState] = {}
 
         for bar_type in self.bar_types:
-            self.indicators_state[bar_type] = {
-                'ema10': PyExponentialMovingAverage(10),
-                'ema20': PyExponentialMovingAverage(20),
-                'prev_ema10': None,
-                'prev_ema20': None
-            }
+            self.indicators_state[bar_type] = _BarState()
 
     def on_start(self):
         self.start_time = dt.datetime.now()
         self.log.info(f"Strategy started at: {self.start_time}")
 
         for bar_type in self.bar_types:
+            self._instruments[bar_type.instrument_id] = self.cache.instrument(bar_type.instrument_id)
+
             # 1. Subscribe to the specific bar type (Instrument + Timeframe)
             self.subscribe_bars(bar_type)
 
             # 2. Register the specific indicators for this bar type
             indicators = self.indicators_state[bar_type]
-            self.register_indicator_for_bars(bar_type, indicators['ema10'])
-            self.register_indicator_for_bars(bar_type, indicators['ema20'])
+            self.register_indicator_for_bars(bar_type, indicators.ema10)
+            self.register_indicator_for_bars(bar_type, indicators.ema20)
 
             self.log.info(f"Registered indicators for {bar_type}")
 
@@ -69,46 +100,48 @@ class DemoStrategy(Strategy):
         # Retrieve the state specific to this bar's type (e.g., VTI-1-DAY)
         state = self.indicators_state.get(bar.bar_type)
 
-        if not state:
+        if state is None:
             return  # Should not happen if registered correctly
 
-        ema10 = state['ema10']
-        ema20 = state['ema20']
-
-        # Ensure indicators are ready for this specific series
-        if not ema10.initialized or not ema20.initialized:
+        # Ensure indicators are ready for this specific series. The first ready bar only
+        # records the previous values, so after warm-up they are never None.
+        if not state.warm:
+            if not state.ema10.initialized or not state.ema20.initialized:
+                return
+            state.warm = True
+            state.prev_ema10 = state.ema10.value
+            state.prev_ema20 = state.ema20.value
             return
 
-        current_ema10 = ema10.value
-        current_ema20 = ema20.value
+        current_ema10 = state.ema10.value
+        current_ema20 = state.ema20.value
 
-        prev_ema10 = state['prev_ema10']
-        prev_ema20 = state['prev_ema20']
+        prev_ema10 = state.prev_ema10
+        prev_ema20 = state.prev_ema20
 
-        # We need previous values to detect a cross
-        if prev_ema10 is not None and prev_ema20 is not None:
-            # Golden Cross: 10 crosses above 20
-            if prev_ema10 <= prev_ema20 and current_ema10 > current_ema20:
-                self._check_buy_signal(bar, state)  # Pass state to access/log specific context
+        # Golden Cross: 10 crosses above 20
+        if prev_ema10 <= prev_ema20 and current_ema10 > current_ema20:
+            self._check_buy_signal(bar, state)  # Pass state to access/log specific context
 
-            # Death Cross: 10 crosses below 20
-            elif prev_ema10 >= prev_ema20 and current_ema10 < current_ema20:
-                self._check_sell_signal(bar, state)
+        # Death Cross: 10 crosses below 20
+        elif prev_ema10 >= prev_ema20 and current_ema10 < current_ema20:
+            self._check_sell_signal(bar, state)
 
         # Update state for next bar for this specific bar type
-        state['prev_ema10'] = current_ema10
-        state['prev_ema20'] = current_ema20
+        state.prev_ema10 = current_ema10
+        state.prev_ema20 = current_ema20
 
-    def _check_buy_signal(self, bar: Bar, state: dict):
+    def _check_buy_signal(self, bar: Bar, state: _BarState):
         instrument_id = bar.bar_type.instrument_id
-        ema10 = state['ema10']
-        ema20 = state['ema20']
+        ema10 = state.ema10
+        ema20 = state.ema20
 
         # Only buy if we don't have a position
-        if self.portfolio.is_flat(instrument_id):
-            self.log.info(f"Golden Cross ({instrument_id} EMA10={ema10.value:.4f} > EMA20={ema20.value:.4f}). BUYING.", color=LogColor.GREEN)
+        if instrument_id not in self._position_sides:
+            if self._log_events:
+                self.log.info(f"Golden Cross ({instrument_id} EMA10={ema10.value:.4f} > EMA20={ema20.value:.4f}). BUYING.", color=LogColor.GREEN)
 
-            instrument = self.cache.instrument(instrument_id)
+            instrument = self._instruments.get(instrument_id)
             if instrument:
                 qty = instrument.make_qty(self.quantity)
                 order = self.order_factory.market(
@@ -120,36 +153,47 @@ class DemoStrategy(Strategy):
             else:
                 self.log.error(f"Instrument {instrument_id} not found in cache.")
 
-    def _check_sell_signal(self, bar: Bar, state: dict):
+    def _check_sell_signal(self, bar: Bar, state: _BarState):
         instrument_id = bar.bar_type.instrument_id
-        ema10 = state['ema10']
-        ema20 = state['ema20']
+        ema10 = state.ema10
+        ema20 = state.ema20
 
         # Only sell if we have a long position
-        if self.portfolio.is_net_long(instrument_id):
-            self.log.info(f"Death Cross ({instrument_id} EMA10={ema10.value:.4f} < EMA20={ema20.value:.4f}). SELLING.", color=LogColor.RED)
+        if self._position_sides.get(instrument_id) == PositionSide.LONG:
+            if self._log_events:
+                self.log.info(f"Death Cross ({instrument_id} EMA10={ema10.value:.4f} < EMA20={ema20.value:.4f}). SELLING.", color=LogColor.RED)
             self.close_all_positions(instrument_id)
 
     def on_order_filled(self, event: OrderFilled):
-        self.log.info(f"Order Filled: {pd.Timestamp(event.ts_event)} {event.order_side} {event.last_qty} @ {event.last_px}", color=LogColor.BLUE)
+        if self._log_events:
+            self.log.info(f"Order Filled: {unix_ns_to_str(event.ts_event)} {event.order_side} {event.last_qty} @ {event.last_px}", color=LogColor.BLUE)
 
     def on_position_opened(self, event: PositionOpened):
-        self.log.info(f"Position Opened: {event.instrument_id} {pd.Timestamp(event.ts_event)}  Qty: {event.quantity}", color=LogColor.CYAN)
+        self._position_sides[event.instrument_id] = event.side
+        if self._log_events:
+            self.log.info(f"Position Opened: {event.instrument_id} {unix_ns_to_str(event.ts_event)}  Qty: {event.quantity}", color=LogColor.CYAN)
 
     def on_position_changed(self, event: PositionChanged):
-        self.log.info(f"Position Changed: {event.instrument_id} {pd.Timestamp(event.ts_event)}  Qty: {event.quantity}", color=LogColor.CYAN)
+        self._position_sides[event.instrument_id] = event.side
+        if self._log_events:
+            self.log.info(f"Position Changed: {event.instrument_id} {unix_ns_to_str(event.ts_event)}  Qty: {event.quantity}", color=LogColor.CYAN)
 
     def on_position_closed(self, event: PositionClosed):
-        self.log.info(f"Position Closed: {event.instrument_id} {pd.Timestamp(event.ts_event)} ", color=LogColor.CYAN)
+        self._position_sides.pop(event.instrument_id, None)
+        if self._log_events:
+            self.log.info(f"Position Closed: {event.instrument_id} {unix_ns_to_str(event.ts_event)} ", color=LogColor.CYAN)
+
+    def on_reset(self):
+        # A reset engine starts with no positions, so forget the sides tracked in the previous run
+        self._position_sides.clear()
+
+    def on_dispose(self):
+        self._position_sides.clear()
 
     def on_stop(self):
         self.end_time = dt.datetime.now()
         self.log.info(f"Strategy finished at: {self.end_time}")
 
         # Close positions for all instruments involved in the strategy
-        closed_instruments = set()
-        for bar_type in self.bar_types:
-            instrument_id = bar_type.instrument_id
-            if instrument_id not in closed_instruments:
-                self.close_all_positions(instrument_id)
-                closed_instruments.add(instrument_id)
+        for instrument_id in self._unique_instruments:
+            self.close_all_positions(instrument_id)
@@ -1,3 +1,8 @@
+import bisect
+import functools
+import math
+
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.model.data import Bar, BarType
@@ -7,10 +12,72 @@ from nautilus_trader.model.events import OrderFilled, OrderRejected, OrderDenied
 from pathlib import Path
 
 from sinly_quant.constants import RESULTS_PATH
-from sinly_quant.util import get_timestamp_suffix
+from sinly_quant.util import get_timestamp_suffix, unix_to_iso_date
 from sinly_quant.my_indicators.swing_levels import SwingLevels
 from sinly_quant.strategies.base_strategy import BaseSinlyStrategy
 
+# Rows (one per subscribed bar type) and columns of the OHLC cache
+A_S, B_S, RATIO_S, A_L, B_L, RATIO_L = range(6)
+OPEN, HIGH, LOW, CLOSE = range(4)
+# History column for each cell of the flattened OHLC cache, in row-major order
+_OHLC_COLUMNS = tuple(
+    f"bar_{name}_{field}"
+    for name in ('a_s', 'b_s', 'ratio_s', 'a_l', 'b_l', 'ratio_l')
+    for field in ('o', 'h', 'l', 'c')
+)
+# Offsets into the flattened cache: start of the long timeframe rows, and the asset closes
+_LONG_START = A_L * 4
+_CLOSE_A = A_S * 4 + CLOSE
+_CLOSE_B = B_S * 4 + CLOSE
+_RATIO_S_HIGH = RATIO_S * 4 + HIGH
+_RATIO_S_LOW = RATIO_S * 4 + LOW
+# Columns of the history table. Rows are stored as tuples in this order: the long
+# swing index, the flattened OHLC cache (shifted by one), then the swing levels.
+_HISTORY_COLUMNS = ('l_index', *_OHLC_COLUMNS, 'swing_s_low', 'swing_s_high', 'swing_l_low', 'swing_l_high')
+_ROW_L_INDEX = 0
+_ROW_OHLC = 1
+_ROW_LONG = slice(_ROW_OHLC + _LONG_START, _ROW_OHLC + len(_OHLC_COLUMNS))
+_ROW_SWING_S_LOW, _ROW_SWING_S_HIGH, _ROW_SWING_L_LOW, _ROW_SWING_L_HIGH = range(
+    _ROW_OHLC + len(_OHLC_COLUMNS), len(_HISTORY_COLUMNS)
+)
+
+
+def _changed(curr: float, last: float) -> bool:
+    """
+    Returns whether a cached price differs from its last recorded value, where NaN (not yet seen)
+    equals NaN.
+    """
+    return curr != last and (curr == curr or last == last)
+
+
+@functools.lru_cache(maxsize=1024)
+def _limit_price(price: float) -> Price:
+    """
+    Returns the limit order price for `price`, rounded to 4 decimals. Prices are immutable, so
+    rebalances at the same close reuse the parsed object.
+    """
+    return Price.from_str(f"{price:.4f}")
+
+
+def _rebalance_targets(total_position: float, ratio_h: float,
+                       price_buy: float, price_sell: float,
+                       qty_buy: float, qty_sell: float) -> tuple[int, int, float]:
+    """
+    Returns (qty_to_sell_l, qty_to_buy_h, ratio_low) for moving the pair to `ratio_h`.
+
+    Negative quantities mean the opposite side (buy the low asset, sell the high asset).
+    `ratio_low` is the low asset's current share of `total_position`.
+    """
+    target_val_h = total_position * ratio_h
+    target_val_l = total_position - target_val_h
+
+    qty_to_sell_l = int(qty_sell - target_val_l // price_sell)
+    qty_to_buy_h = int(target_val_h // price_buy - qty_buy)
+
+    ratio_low = qty_sell * price_sell / total_position if total_position > 0 else 0
+    return qty_to_sell_l, qty_to_buy_h, ratio_low
+
+
 class PairRatioStrategy(BaseSinlyStrategy):
     def __init__(self,
                  bar_a_s: BarType,
@@ -40,18 +107,25 @@ class PairRatioStrategy(BaseSinlyStrategy):
         self.bar_b_l = bar_b_l
         self.bar_ratio_l = bar_ratio_l
 
+        # One dict lookup per bar instead of comparing against each bar type in turn
+        self._bar_slots = {
+            bar_a_s: A_S, bar_b_s: B_S, bar_ratio_s: RATIO_S,
+            bar_a_l: A_L, bar_b_l: B_L, bar_ratio_l: RATIO_L,
+        }
+
         self.ratio_h = split_ratio
         self.thresh_hold = thresh_hold
 
-        # State caches for all bars (OHLC)
-        self.cache_a_s = {'o': None, 'h': None, 'l': None, 'c': None}
-        self.cache_b_s = {'o': None, 'h': None, 'l': None, 'c': None}
-        self.cache_ratio_s = {'o': None, 'h': None, 'l': None, 'c': None}
-        self.cache_a_l = {'o': None, 'h': None, 'l': None, 'c': None}
-        self.cache_b_l = {'o': None, 'h': None, 'l': None, 'c': None}
-        self.cache_ratio_l = {'o': None, 'h': None, 'l': None, 'c': None}
+        # Latest OHLC of every bar type, one row per slot; NaN until the first bar arrives
+        self._ohlc = np.full((6, 4), np.nan)
 
-        self.df_history = pd.DataFrame()
+        # One history row per bar timestamp, appended in O(1); see `df_history`
+        self._rows: list[tuple] = []
+        # Row timestamps are kept as UNIX nanoseconds and only converted when the table is built
+        self._row_ts: list[int] = []
+        self._ts_index: dict[int, int] = {}
+        # Indices of the rows that have a long swing high or low, in row order
+        self._swing_l_rows: list[int] = []
 
         # Indicator for the Ratio (Synthetic)
         # We will feed this manually using update_raw()
@@ -69,6 +143,8 @@ class PairRatioStrategy(BaseSinlyStrategy):
         self.last_acted_breakout = None
 
         self.venue = bar_a_s.instrument_id.venue
+        self.inst_a = bar_a_s.instrument_id
+        self.inst_b = bar_b_s.instrument_id
 
     def on_start(self):
         # 1. Subscribe to all data streams
@@ -80,6 +156,8 @@ class PairRatioStrategy(BaseSinlyStrategy):
         self.subscribe_bars(self.bar_b_l)
         self.subscribe_bars(self.bar_ratio_l)
 
+        # Each swing indicator only sees its own ratio bars. on_bar reads the pivots as None until a
+        # swing is confirmed, so no separate `initialized` gate is needed on the bar path.
         self.register_indicator_for_bars(self.bar_ratio_s, self.swing_levels_s)
         self.register_indicator_for_bars(self.bar_ratio_l, self.swing_levels_l)
 
@@ -101,12 +179,12 @@ class PairRatioStrategy(BaseSinlyStrategy):
         #               buy asset B with proper portation
         #
         #
-        #   if pre_swing_l_low and self.cache_ratio_s["l"] < pre_swing_l_low:
+        #   if pre_swing_l_low and ratio_s low < pre_swing_l_low:
         #       if asset A position exists:
         #           close asset A and buy asset B with proper portation
         #       else:
         #           buy asset B with proper portation
-        #   elif pre_swing_l_high and self.cache_ratio_s["h"] > pre_swing_l_high:
+        #   elif pre_swing_l_high and ratio_s high > pre_swing_l_high:
         #       if asset B position exists:
         #           close asset B and buy asset A with proper portation
         #       else:
@@ -114,121 +192,102 @@ class PairRatioStrategy(BaseSinlyStrategy):
 
 
         # Update local state cache for dataframe construction
-        ohlc = {
-            'o': bar.open.as_double(),
-            'h': bar.high.as_double(),
-            'l': bar.low.as_double(),
-            'c': bar.close.as_double()
-        }
+        slot = self._bar_slots.get(bar.bar_type)
+        if slot is not None:
+            self._ohlc[slot] = (bar.open.as_double(), bar.high.as_double(), bar.low.as_double(), bar.close.as_double())
+        # Signals and history rows only depend on ratio bars; the other bars just refresh the
+        # cache, which is current by the time the ratio bar of the same timestamp arrives
+        if slot != RATIO_S and slot != RATIO_L:
+            return
+        ohlc = self._ohlc.ravel().tolist()
 
-        if bar.bar_type == self.bar_a_s:
-            self.cache_a_s = ohlc
-        elif bar.bar_type == self.bar_b_s:
-            self.cache_b_s = ohlc
-        elif bar.bar_type == self.bar_ratio_s:
-            self.cache_ratio_s = ohlc
-        elif bar.bar_type == self.bar_a_l:
-            self.cache_a_l = ohlc
-        elif bar.bar_type == self.bar_b_l:
-            self.cache_b_l = ohlc
-        elif bar.bar_type == self.bar_ratio_l:
-            self.cache_ratio_l = ohlc
-
-        ts = pd.Timestamp(bar.ts_event, unit='ns')
+        ts = bar.ts_event
 
         l_index = 0
 
         # Determine the reference row (strictly previous history)
         last_row = None
 
-        if not self.df_history.empty:
+        if self._rows:
             # Check if likely appending (common case)
-            if self.df_history.index[-1] < ts:
-                last_row = self.df_history.iloc[-1]
-            elif self.df_history.index[-1] == ts:
+            if self._row_ts[-1] < ts:
+                last_row = self._rows[-1]
+            elif self._row_ts[-1] == ts:
                 # Updating the latest row -> look at the one before it
-                if len(self.df_history) > 1:
-                    last_row = self.df_history.iloc[-2]
+                if len(self._rows) > 1:
+                    last_row = self._rows[-2]
             else:
-                # Out of order or updating older row -> safe search
-                history_before = self.df_history[self.df_history.index < ts]
-                if not history_before.empty:
-                    last_row = history_before.iloc[-1]
+                # Out of order or updating older row -> latest row before ts
+                for i in range(len(self._rows) - 1, -1, -1):
+                    if self._row_ts[i] < ts:
+                        last_row = self._rows[i]
+                        break
 
         if last_row is not None:
-            last_l_index = int(last_row['l_index'])
-
-            def is_diff(v1, v2):
-                n1 = v1 is None or pd.isna(v1)
-                n2 = v2 is None or pd.isna(v2)
-                if n1 and n2: return False
-                if n1 != n2: return True
-                return float(v1) != float(v2)
-
-            long_vals = [
-                (self.cache_a_l['o'], last_row['bar_a_l_o']), (self.cache_a_l['h'], last_row['bar_a_l_h']),
-                (self.cache_a_l['l'], last_row['bar_a_l_l']), (self.cache_a_l['c'], last_row['bar_a_l_c']),
-                (self.cache_b_l['o'], last_row['bar_b_l_o']), (self.cache_b_l['h'], last_row['bar_b_l_h']),
-                (self.cache_b_l['l'], last_row['bar_b_l_l']), (self.cache_b_l['c'], last_row['bar_b_l_c']),
-                (self.cache_ratio_l['o'], last_row['bar_ratio_l_o']), (self.cache_ratio_l['h'], last_row['bar_ratio_l_h']),
-                (self.cache_ratio_l['l'], last_row['bar_ratio_l_l']), (self.cache_ratio_l['c'], last_row['bar_ratio_l_c']),
-            ]
-
-            if any(is_diff(curr, last) for curr, last in long_vals):
+            last_l_index = int(last_row[_ROW_L_INDEX])
+
+            # Tuple equality runs in C and settles the common unchanged case; only a mismatch,
+            # which may just be NaN != NaN before every long bar has arrived, needs the
+            # NaN-aware check
+            long_now = tuple(ohlc[_LONG_START:])
+            long_last = last_row[_ROW_LONG]
+            if long_now != long_last and any(map(_changed, long_now, long_last)):
                 l_index = last_l_index + 1
             else:
                 l_index = last_l_index
-        data = {
-            "l_index": l_index,
-
-            # Short timeframe bars
-            "bar_a_s_o": self.cache_a_s['o'], "bar_a_s_h": self.cache_a_s['h'], "bar_a_s_l": self.cache_a_s['l'], "bar_a_s_c": self.cache_a_s['c'],
-            "bar_b_s_o": self.cache_b_s['o'], "bar_b_s_h": self.cache_b_s['h'], "bar_b_s_l": self.cache_b_s['l'], "bar_b_s_c": self.cache_b_s['c'],
-            "bar_ratio_s_o": self.cache_ratio_s['o'], "bar_ratio_s_h": self.cache_ratio_s['h'], "bar_ratio_s_l": self.cache_ratio_s['l'], "bar_ratio_s_c": self.cache_ratio_s['c'],
-
-            # Long timeframe bars
-            "bar_a_l_o": self.cache_a_l['o'], "bar_a_l_h": self.cache_a_l['h'], "bar_a_l_l": self.cache_a_l['l'], "bar_a_l_c": self.cache_a_l['c'],
-            "bar_b_l_o": self.cache_b_l['o'], "bar_b_l_h": self.cache_b_l['h'], "bar_b_l_l": self.cache_b_l['l'], "bar_b_l_c": self.cache_b_l['c'],
-            "bar_ratio_l_o": self.cache_ratio_l['o'], "bar_ratio_l_h": self.cache_ratio_l['h'], "bar_ratio_l_l": self.cache_ratio_l['l'], "bar_ratio_l_c": self.cache_ratio_l['c'],
-
-            # Indicators
-            "swing_s_low": self.swing_levels_s.pivot_low, "swing_s_high": self.swing_levels_s.pivot_high,
-            "swing_l_low": self.swing_levels_l.pivot_low, "swing_l_high": self.swing_levels_l.pivot_high,
-        }
+        # Short and long timeframe bars, then indicators (see _HISTORY_COLUMNS)
+        swing_l_low = self.swing_levels_l.pivot_low
+        swing_l_high = self.swing_levels_l.pivot_high
+        data = (
+            l_index, *ohlc,
+            self.swing_levels_s.pivot_low, self.swing_levels_s.pivot_high, swing_l_low, swing_l_high,
+        )
+
+        has_swing_l = swing_l_high is not None or swing_l_low is not None
 
         # Check if timestamp exists in history
-        if ts in self.df_history.index:
-            # Update existing row with latest data/cache
-            # Using .loc[ts] = Series(data) to update the row
-            self.df_history.loc[ts] = pd.Series(data)
+        row_i = self._ts_index.get(ts)
+        if row_i is not None:
+            # Update existing row with latest data/cache. This happens when the short and long
+            # ratio bars share a ts_event; `data` is a full row snapshot, so replacing the slot
+            # keeps the last-write-wins result of the old `df_history.loc[ts] = pd.Series(data)`
+            self._rows[row_i] = data
+            pos = bisect.bisect_left(self._swing_l_rows, row_i)
+            listed = pos < len(self._swing_l_rows) and self._swing_l_rows[pos] == row_i
+            if has_swing_l and not listed:
+                self._swing_l_rows.insert(pos, row_i)
+            elif not has_swing_l and listed:
+                del self._swing_l_rows[pos]
         else:
             # Create new row
-            new_row = pd.DataFrame([data], index=[ts])
-            new_row.index.name = 'date'
-            if self.df_history.empty:
-                self.df_history = new_row
-            else:
-                self.df_history = pd.concat([self.df_history, new_row])
+            row_i = len(self._rows)
+            self._ts_index[ts] = row_i
+            self._rows.append(data)
+            self._row_ts.append(ts)
+            if has_swing_l:
+                self._swing_l_rows.append(row_i)
 
         # First, let's calculate the equity values of the portfolio
-        inst_a = self.bar_a_s.instrument_id
-        inst_b = self.bar_b_s.instrument_id
+        inst_a = self.inst_a
+        inst_b = self.inst_b
         # debug: pd.Timestamp(bar.ts_event, unit='ns').strftime('%Y-%m-%d') == '2009-03-23' and str(bar.bar_type) == 'VTI-GLD.ABC-1-WEEK-LAST-EXTERNAL'
         # debug: pd.Timestamp(bar.ts_event, unit='ns').strftime('%Y-%m-%d') == '2009-07-23' and str(bar.bar_type) == 'VTI-GLD.ABC-1-DAY-LAST-EXTERNAL'
 
+        # get the current close prices; nothing to value until both assets have traded
+        price_a = ohlc[_CLOSE_A]
+        price_b = ohlc[_CLOSE_B]
+
+        if math.isnan(price_a) or math.isnan(price_b):
+            return
+
+        # Portfolio state is read once per bar and passed down. It is not reused across bars:
+        # orders submitted on the short ratio bar lock cash before the long one arrives.
         # get the current quantities held
         qty_a = self.get_quote_qty(inst_a)
         qty_b = self.get_quote_qty(inst_b)
 
-        # get the current close prices
-        price_a = self.cache_a_s['c']
-        price_b = self.cache_b_s['c']
-
-        if price_a is None or price_b is None:
-            return
-
         # get the current cash balance in quote currency
-        cash = self.get_available_cash(inst_a.venue)
+        cash = self.get_available_cash(self.venue)
 
 
         val_a = 0.0
@@ -245,29 +304,31 @@ class PairRatioStrategy(BaseSinlyStrategy):
         pre_swing_l_high = None
         pre_swing_l_ts = None
 
-        swing_l_history = self.df_history[['swing_l_high', 'swing_l_low']].dropna(how='all')
-        if ts in swing_l_history.index:
-            swing_l_history = swing_l_history.drop(ts)
-        if not swing_l_history.empty:
-            pre_swing_l = swing_l_history.iloc[-1]
-            pre_swing_l_ts = pre_swing_l.name
-            pre_swing_l_high = pre_swing_l['swing_l_high'] if pd.notna(pre_swing_l['swing_l_high']) else None
-            pre_swing_l_low = pre_swing_l['swing_l_low'] if pd.notna(pre_swing_l['swing_l_low']) else None
-            # pre_swing_l_idx = pre_swing_l['l_index'] if pd.notna(pre_swing_l['l_index']) else None
-
-        # Get the latest row from your dataframe
-        latest_row = self.df_history.iloc[-1]
+        # Latest row (other than this bar's) with a long swing high or low
+        has_swing_l_history = False
+        for i in reversed(self._swing_l_rows):
+            if i == row_i:
+                continue
+            pre_swing_l = self._rows[i]
+            has_swing_l_history = True
+            pre_swing_l_ts = self._row_ts[i]
+            pre_swing_l_high = pre_swing_l[_ROW_SWING_L_HIGH]
+            pre_swing_l_low = pre_swing_l[_ROW_SWING_L_LOW]
+            break
+
+        # The latest history row is the one just written for this bar, so read its swing levels
+        # and short ratio range from the locals it was built from
+        latest_swing_l_high = swing_l_high
+        latest_swing_l_low = swing_l_low
 
         # first order
-        if total_equity == 0 and bar.bar_type == self.bar_ratio_l and not self.df_history.empty:
+        if total_equity == 0 and slot == RATIO_L:
             # access position: self.cache.positions(instrument_id=self.bar_a_s.instrument_id)
-            latest_swing_l_high = latest_row['swing_l_high']
-            latest_swing_l_low = latest_row['swing_l_low']
 
-            if pd.isna(latest_swing_l_low) and pd.isna(latest_swing_l_high):
+            if latest_swing_l_low is None and latest_swing_l_high is None:
                 return
 
-            if pd.notna(latest_swing_l_low):
+            if latest_swing_l_low is not None:
                 self._calc_submit_orders(
                     asset_h={'id': inst_a, 'price': price_a, 'qty': qty_a},
                     asset_l={'id': inst_b, 'price': price_b, 'qty': qty_b},
@@ -275,7 +336,7 @@ class PairRatioStrategy(BaseSinlyStrategy):
                     ratio_h=self.ratio_h,
                     ratio_threshold=self.thresh_hold
                 )
-            elif pd.notna(latest_swing_l_high):
+            elif latest_swing_l_high is not None:
                 self._calc_submit_orders(
                     asset_h={'id': inst_b, 'price': price_b, 'qty': qty_b},
                     asset_l={'id': inst_a, 'price': price_a, 'qty': qty_a},
@@ -286,14 +347,16 @@ class PairRatioStrategy(BaseSinlyStrategy):
             return
 
 
-        # There is no previous swing long high or low, return
-        if not pre_swing_l_high and not pre_swing_l_low:
+        # There is no previous swing long high or low, return. Checked by presence rather than
+        # truthiness so a swing level of 0.0 still counts.
+        if not has_swing_l_history:
             return
 
 
-        if bar.bar_type == self.bar_ratio_s and (pre_swing_l_low or pre_swing_l_high):
+        if slot == RATIO_S:
             self._bos_allocation(
-                latest_row=latest_row,
+                bar_ratio_s_h=ohlc[_RATIO_S_HIGH],
+                bar_ratio_s_l=ohlc[_RATIO_S_LOW],
                 pre_swing_l_low=pre_swing_l_low,
                 pre_swing_l_high=pre_swing_l_high,
                 pre_swing_l_ts=pre_swing_l_ts,
@@ -302,11 +365,11 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 total_position=total_position
             )
 
-        if bar.bar_type == self.bar_ratio_l and not self.df_history.empty:
+        if slot == RATIO_L:
             self._normal_allocation(
-                latest_swing_l_low=latest_row['swing_l_low'],
-                latest_swing_l_high=latest_row['swing_l_high'],
-                swing_l_history=swing_l_history,
+                latest_swing_l_low=latest_swing_l_low,
+                latest_swing_l_high=latest_swing_l_high,
+                has_swing_l_history=has_swing_l_history,
                 pre_swing_l_low=pre_swing_l_low,
                 pre_swing_l_high=pre_swing_l_high,
                 inst_a=inst_a, price_a=price_a, qty_a=qty_a,
@@ -314,15 +377,13 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 total_position=total_position
             )
 
-    def _bos_allocation(self, latest_row, pre_swing_l_low, pre_swing_l_high, pre_swing_l_ts,
+    def _bos_allocation(self, bar_ratio_s_h, bar_ratio_s_l, pre_swing_l_low, pre_swing_l_high, pre_swing_l_ts,
                         inst_a, price_a, qty_a,
                         inst_b, price_b, qty_b,
                         total_position):
         # TODO, should we check if the swing_l_low and swing_l_high exist at the same time?
-        bar_ratio_s_h = latest_row['bar_ratio_s_h']
-        bar_ratio_s_l = latest_row['bar_ratio_s_l']
 
-        if pd.notna(pre_swing_l_low) and bar_ratio_s_l < pre_swing_l_low:
+        if pre_swing_l_low is not None and bar_ratio_s_l < pre_swing_l_low:
             # Check duplication
             if self.last_acted_breakout != (pre_swing_l_ts, 'low'):
                 self.log.info(f"Signal: Short Swing Low Breakout detected.")
@@ -337,7 +398,7 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 )
                 self.last_acted_breakout = (pre_swing_l_ts, 'low')
 
-        elif pd.notna(pre_swing_l_high) and bar_ratio_s_h > pre_swing_l_high:
+        elif pre_swing_l_high is not None and bar_ratio_s_h > pre_swing_l_high:
             # Check duplication
             if self.last_acted_breakout != (pre_swing_l_ts, 'high'):
                 self.log.info(f"Signal: Short Swing High Breakout detected.")
@@ -352,15 +413,15 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 )
                 self.last_acted_breakout = (pre_swing_l_ts, 'high')
 
-    def _normal_allocation(self, latest_swing_l_low, latest_swing_l_high, swing_l_history,
+    def _normal_allocation(self, latest_swing_l_low, latest_swing_l_high, has_swing_l_history,
                            pre_swing_l_low, pre_swing_l_high,
                            inst_a, price_a, qty_a,
                            inst_b, price_b, qty_b,
                            total_position):
-        if pd.isna(latest_swing_l_low) and pd.isna(latest_swing_l_high):
+        if latest_swing_l_low is None and latest_swing_l_high is None:
             return
 
-        if pd.notna(latest_swing_l_low) and not swing_l_history.empty:
+        if latest_swing_l_low is not None and has_swing_l_history:
             # if pd.notna(pre_swing_l_high):
             self._calc_submit_orders(
                 asset_h={'id': inst_a, 'price': price_a, 'qty': qty_a},
@@ -372,7 +433,7 @@ class PairRatioStrategy(BaseSinlyStrategy):
             )
             # elif pre_swing_l_low:
             #     self.log.info(f"Signal: Long Swing Low Breakout detected.")
-        elif pd.notna(latest_swing_l_high) and not swing_l_history.empty:
+        elif latest_swing_l_high is not None and has_swing_l_history:
             # if pd.notna(pre_swing_l_low):
             self._calc_submit_orders(
                 asset_h={'id': inst_b, 'price': price_b, 'qty': qty_b},
@@ -420,23 +481,12 @@ class PairRatioStrategy(BaseSinlyStrategy):
 
         ratio_l = 1.0 - ratio_h
 
-        # 1. Calculate Targets in Value
-        target_val_h = total_position * ratio_h
-        target_val_l = total_position - target_val_h
-
-        # 2. Calculate Exact Quantity Deltas
-        # Target for Lower Ratio Asset (Sell side usually)
-        target_qty_l = target_val_l // cur_price_sell
-        qty_to_sell_l = int(qty_sell - target_qty_l)
-
-        # Target for Higher Ratio Asset (Buy side usually)
-        target_qty_h = target_val_h // cur_price_buy
-        qty_to_buy_h = int(target_qty_h - qty_buy)
+        # 1-2. Calculate exact quantity deltas towards the target values
+        qty_to_sell_l, qty_to_buy_h, ratio_low = _rebalance_targets(
+            total_position, ratio_h, cur_price_buy, cur_price_sell, qty_buy, qty_sell
+        )
 
         # 3. Log Condition (Informational)
-        val_low = qty_sell * cur_price_sell
-        ratio_low = val_low / total_position if total_position > 0 else 0
-
         if ratio_low > (ratio_h - ratio_threshold):
             self.log.info(
                 f"Rebalance Trigger (Flip): Asset {inst_id_sell} is {ratio_low:.2%} of portfolio. Flipping to {inst_id_buy}={ratio_h:.2%}, {inst_id_sell}={ratio_l:.2%}")
@@ -445,8 +495,8 @@ class PairRatioStrategy(BaseSinlyStrategy):
 
         # 4. Execute Orders with Chain Logic
         sold_something = False
-        limit_price_b = format(cur_price_sell, '.4f')
-        limit_price_a = format(cur_price_buy, '.4f')
+        limit_price_b = _limit_price(cur_price_sell)
+        limit_price_a = _limit_price(cur_price_buy)
 
         # --- EXECUTE SELLS (Immediate) ---
         # Check if we need to Sell B (the low ratio asset)
@@ -456,7 +506,7 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 instrument_id=inst_id_sell,
                 order_side=OrderSide.SELL,
                 quantity=Quantity.from_int(qty_to_sell_l),
-                price=Price.from_str(str(limit_price_b)),
+                price=limit_price_b,
                 time_in_force=TimeInForce.GTC,
                 reduce_only=True,
             ))
@@ -469,32 +519,29 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 instrument_id=inst_id_buy,
                 order_side=OrderSide.SELL,
                 quantity=Quantity.from_int(abs(qty_to_buy_h)),
-                price=Price.from_str(str(limit_price_a)),
+                price=limit_price_a,
                 time_in_force=TimeInForce.GTC,
                 reduce_only=True,
             ))
 
         # --- EXECUTE BUYS (Deferred or Immediate) ---
-        def execute_or_defer_buy(inst_id, qty, price_str):
+        def execute_or_defer_buy(inst_id, qty, price):
             if qty <= 0: return
 
+            order = self.order_factory.limit(
+                instrument_id=inst_id,
+                order_side=OrderSide.BUY,
+                quantity=Quantity.from_int(qty),
+                price=price,
+                time_in_force=TimeInForce.GTC
+            )
             if sold_something:
-                # Store instruction for on_order_filled
+                # Hold the built order for on_order_filled
                 self.log.info(f"Deferring BUY {qty} of {inst_id} until SELL fills.")
-                self.pending_buy_instruction = {
-                    'instrument_id': inst_id,
-                    'quantity': qty,
-                    'price': price_str
-                }
+                self.pending_buy_instruction = order
             else:
                 # Immediate execution
-                self.submit_order(self.order_factory.limit(
-                    instrument_id=inst_id,
-                    order_side=OrderSide.BUY,
-                    quantity=Quantity.from_int(qty),
-                    price=Price.from_str(price_str),
-                    time_in_force=TimeInForce.GTC
-                ))
+                self.submit_order(order)
 
         # Calculate if we need to buy B (rare, usually we sell B here)
         if qty_to_sell_l < 0:
@@ -517,20 +564,26 @@ class PairRatioStrategy(BaseSinlyStrategy):
                 self.log.error(f"Could not create output directory {self.output_path}: {e}")
                 return
 
-        if not self.df_history.empty:
-            # Filename with timestamp tail
-            file_name = f"strategy_history_{self.run_id}.xlsx"
-            file_path = self.output_path / file_name
-            self.df_history.to_excel(file_path)
+        # Emptiness is checked on the row lists, so each table is built at most once
+        if self._rows:
+            df_history = self.df_history
+            # Filename with timestamp tail. The history has a row per ratio bar, so it is written
+            # as columnar Parquet; CSV is the fallback if no Parquet engine is installed.
+            file_path = self.output_path / f"strategy_history_{self.run_id}.parquet"
+            try:
+                df_history.to_parquet(file_path, compression='zstd')
+            except ImportError:
+                file_path = file_path.with_suffix('.csv')
+                df_history.to_csv(file_path)
             self.log.info(f"History saved to {file_path}")
 
             # If you must print to log, convert to string first, but it can be very long
-            self.log.info(f"Final Info:\n{self.df_history.tail()}")
+            self.log.info(f"Final Info:\n{df_history.tail()}")
         else:
             self.log.info("History DataFrame is empty.")
 
         # Save Fills/Trade History
-        if not self.fills_df.empty:
+        if self.daily_fills_log:
             file_name = f"fills_history_{self.run_id}.xlsx"
             fills_path = self.output_path / file_name
             # Sort by date before saving
@@ -541,16 +594,27 @@ class PairRatioStrategy(BaseSinlyStrategy):
         else:
             self.log.info("No fills recorded.")
 
+    @property
+    def df_history(self) -> pd.DataFrame:
+        """
+        Returns the per-bar strategy history as a pandas DataFrame indexed by date.
+        """
+        if not self._rows:
+            return pd.DataFrame()
+        # Rows are positional tuples, so let pandas build the columns in one pass
+        df = pd.DataFrame.from_records(self._rows, columns=_HISTORY_COLUMNS, coerce_float=True)
+        df.index = pd.to_datetime(self._row_ts, unit='ns').rename('date')
+        return df
+
     def record_fill(self, event: OrderFilled):
         """
         Overrides BaseSinlyStrategy.record_fill to aggregate fills by date (daily rebalancing logic).
         Structure: One row per day with columns for both instruments A and B.
         """
         # 1. Identify context
-        ts = pd.Timestamp(event.ts_event, unit='ns')
-        date_key = ts.strftime('%Y-%m-%d')
-        inst_a_id = self.bar_a_s.instrument_id
-        inst_b_id = self.bar_b_s.instrument_id
+        date_key = unix_to_iso_date(event.ts_event)
+        inst_a_id = self.inst_a
+        inst_b_id = self.inst_b
 
         # 2. Get or Initialize Daily Record
         if date_key not in self.daily_fills_log:
@@ -621,8 +685,7 @@ class PairRatioStrategy(BaseSinlyStrategy):
         qty_b = self.get_quote_qty(inst_b_id)
 
         # Cached Daily Prices (using daily close prices as requested)
-        px_a = self.cache_a_s['c'] if self.cache_a_s['c'] is not None else 0.0
-        px_b = self.cache_b_s['c'] if self.cache_b_s['c'] is not None else 0.0
+        px_a, px_b = np.nan_to_num(self._ohlc[(A_S, B_S), CLOSE]).tolist()
 
         # Available Cash
         cash = self.get_available_cash(self.venue)
@@ -666,20 +729,14 @@ class PairRatioStrategy(BaseSinlyStrategy):
         self.record_fill(event)
 
         # 2. Strategy Specific Logic: Chain Execution (Deferred Buy)
-        if self.pending_buy_instruction and event.order_side == OrderSide.SELL:
-            instr = self.pending_buy_instruction
+        if self.pending_buy_instruction is not None and event.order_side == OrderSide.SELL:
+            order = self.pending_buy_instruction
             # Verify we are not trying to buy what we just sold (unlikely but safe)
             # and that the sell was actually related to our rebalance logic
 
-            self.log.info(f"SELL confirmed. Executing deferred BUY for {instr['instrument_id']}")
+            self.log.info(f"SELL confirmed. Executing deferred BUY for {order.instrument_id}")
 
-            self.submit_order(self.order_factory.limit(
-                instrument_id=instr['instrument_id'],
-                order_side=OrderSide.BUY,
-                quantity=Quantity.from_int(instr['quantity']),
-                price=Price.from_str(str(instr['price'])),
-                time_in_force=TimeInForce.GTC
-            ))
+            self.submit_order(order)
 
             self.pending_buy_instruction = None
 
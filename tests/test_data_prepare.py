@@ -1,6 +1,7 @@
+import pytest
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
-from sinly_quant.data_prepare.data_loaders import load_to_catalog
-from sinly_quant.constants import Venues
+from sinly_quant.data_prepare.data_loaders import load_to_catalog, prepare_tradingview_data
+from sinly_quant.constants import Columns, Venues
 
 
 def test_load_to_catalog_tradingview(mocker, tmp_path):
@@ -28,3 +29,59 @@ def test_load_to_catalog_tradingview(mocker, tmp_path):
     # Check if GLD is present in ANY of the loaded instruments, not just the first one
     instrument_ids = [i.id.value for i in loaded_instruments]
     assert f"{symbol}.{venue}" in instrument_ids
+
+
+def test_load_to_catalog_reuses_unchanged_source(mocker, tmp_path):
+    """
+    Re-loading an unchanged TradingView file should read the bars back from the
+    catalog instead of parsing the CSV again.
+    """
+    symbol = "GLD"
+    venue = Venues.NYSE
+    interval = "1-DAY"
+
+    mocker.patch("sinly_quant.data_prepare.data_loaders.CATALOG_PATH", tmp_path)
+    first_df = load_to_catalog(symbol, venue, interval, data_provider="tradingview")
+
+    prepare = mocker.MagicMock()
+    mocker.patch.dict("sinly_quant.data_prepare.data_loaders.PROVIDERS", {"tradingview": prepare})
+    cached_df = load_to_catalog(symbol, venue, interval, data_provider="tradingview")
+
+    assert not prepare.called
+    assert cached_df.index.equals(first_df.index)
+    assert (cached_df[Columns.CLOSE] == first_df[Columns.CLOSE]).all()
+
+
+def test_prepare_tradingview_data_coerces_bad_cells(mocker, tmp_path):
+    """
+    A non-numeric cell in a TradingView export should become NaN (volume 0) rather
+    than abort the whole load.
+    """
+    csv_path = tmp_path / "TR_GLD_1-DAY.csv"
+    csv_path.write_text(
+        "time,open,high,low,close,Volume\n"
+        "01/02/24,1.0,2.0,0.5,1.5,100\n"
+        "01/03/24,1.5,2.5,1.0,2.0,-\n"
+    )
+    mocker.patch("sinly_quant.data_prepare.data_loaders._tradingview_file_path", return_value=csv_path)
+
+    prepared_data = prepare_tradingview_data("GLD", Venues.NYSE, "1-DAY")
+
+    assert len(prepared_data["bars_list"]) == 2
+    assert prepared_data["bars_list"][1].volume.as_double() == 0.0
+
+
+def test_prepare_tradingview_data_rejects_malformed_dates(mocker, tmp_path):
+    """
+    A date in the wrong format should fail the load instead of leaving the index as strings.
+    """
+    csv_path = tmp_path / "TR_GLD_1-DAY.csv"
+    csv_path.write_text(
+        "time,open,high,low,close,Volume\n"
+        "01/02/24,1.0,2.0,0.5,1.5,100\n"
+        "2024-01-03,1.5,2.5,1.0,2.0,100\n"
+    )
+    mocker.patch("sinly_quant.data_prepare.data_loaders._tradingview_file_path", return_value=csv_path)
+
+    with pytest.raises(ValueError, match="TR_GLD_1-DAY.csv"):
+        prepare_tradingview_data("GLD", Venues.NYSE, "1-DAY")
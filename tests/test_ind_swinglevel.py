@@ -116,6 +116,22 @@ def test_future_invalidation(mock_bar_factory):
     assert indicator.pivot_high is None
 
 
+def test_history_size_keeps_latest_pivots(mock_bar_factory):
+    """
+    With history_size set, only the most recent pivots are retained.
+    Left=1, Right=1. Window=3.
+    Highs alternate 10, 20, so every 20 after the first bar is a pivot high.
+    """
+    indicator = SwingLevels(swing_size_l=1, swing_size_r=1, history_size=2)
+
+    bars = [mock_bar_factory(10 if i % 2 == 0 else 20, 5) for i in range(9)]
+    for bar in bars:
+        indicator.handle_bar(bar)
+
+    # Pivot highs were confirmed on bars 1, 3, 5 and 7; only the last two are kept
+    assert list(indicator.pivot_high_history) == [bars[5], bars[7]]
+
+
 def test_vti_gld(real_data_vti_gld):
     vti_1d, gld_d, vti_1w, gld_1w, vti_gld_1d, vti_gld_1w = real_data_vti_gld
 
@@ -1,3 +1,4 @@
+import shutil
 import pytest
 import pandas as pd
 import os
@@ -124,7 +125,7 @@ def test_calculate_ratios_with_venue_lookup(sample_market_data):
 # 2. Integration Test for Run Ingestion Script with Real Data
 # -------------------------------------------------------------------------
 
-def test_run_ingestion_flow_with_real_data(mocker):
+def test_run_ingestion_flow_with_real_data(mocker, tmp_path):
     """
     Tests the main execution flow of run_ingestion.py using REAL data files.
     We mock load_to_catalog to use prepare_tradingview_data directly,
@@ -169,6 +170,9 @@ def test_run_ingestion_flow_with_real_data(mocker):
         side_effect=mock_load_side_effect
     )
 
+    # Keep the ratio cache out of the real catalog so every run recalculates
+    mocker.patch("sinly_quant.data_prepare.run_ingestion.CATALOG_PATH", tmp_path)
+
     # Mock save_synthetic_to_catalog to avoid writing to disk
     mock_saver = mocker.patch("sinly_quant.data_prepare.run_ingestion.save_synthetic_to_catalog")
 
@@ -209,6 +213,12 @@ def test_run_ingestion_flow_with_real_data(mocker):
     # 7. Assertions
     assert mock_loader.call_count >= 2 # Should be called for GLD and VTI
     assert mock_saver.called
+    # All ratios are written in a single batch
+    assert mock_saver.call_count == 1
+    (synthetic_bars,), _ = mock_saver.call_args
+    instrument, bars = synthetic_bars[0]
+    assert str(instrument.id) == "VTI_GLD.SYNTH"
+    assert bars
 
     # Verify calculator was called
     assert spy_calculator.called
@@ -218,3 +228,41 @@ def test_run_ingestion_flow_with_real_data(mocker):
     returned_ratios = spy_calculator.spy_return
     assert "VTI_GLD_1-DAY" in returned_ratios
     assert not returned_ratios["VTI_GLD_1-DAY"]["df"].empty
+
+
+def test_run_ingestion_skips_unchanged_ratios(mocker, tmp_path, sample_market_data):
+    """
+    A second run with unchanged source files should not recalculate or re-save the ratio,
+    unless its bars have since been deleted from the catalog.
+    """
+    mocker.patch("sinly_quant.data_prepare.run_ingestion.CATALOG_PATH", tmp_path)
+    mocker.patch("sinly_quant.data_prepare.data_loaders.CATALOG_PATH", tmp_path)
+    mocker.patch(
+        "sinly_quant.data_prepare.run_ingestion.load_to_catalog",
+        side_effect=lambda symbol_name, venue_name, interval, data_provider: sample_market_data[symbol_name],
+    )
+    mocker.patch("sinly_quant.data_prepare.run_ingestion.source_mtime_ns", return_value=1)
+    from sinly_quant.data_prepare import run_ingestion
+    spy_saver = mocker.spy(run_ingestion, "save_synthetic_to_catalog")
+
+    test_universe = [
+        {"symbol": "VTI", "venue": Venues.NYSE, "interval": "1-DAY", "provider": "tradingview"},
+        {"symbol": "GLD", "venue": Venues.NYSE, "interval": "1-DAY", "provider": "tradingview"},
+    ]
+    test_ratios = [{"instrument_id_a": "VTI", "instrument_id_b": "GLD", "interval": "1-DAY"}]
+    mocker.patch(
+        "sinly_quant.data_prepare.run_ingestion.load_config_from_csv",
+        side_effect=[test_universe, test_ratios] * 3,
+    )
+
+    run_ingestion_main()
+    assert spy_saver.call_count == 1
+
+    run_ingestion_main()
+    assert spy_saver.call_count == 1
+
+    # Wiping the catalog data leaves a matching cache entry behind, the ratio must still be rebuilt
+    shutil.rmtree(tmp_path / "data")
+    run_ingestion_main()
+    assert spy_saver.call_count == 2
+    assert (tmp_path / "data").exists()
@@ -5,16 +5,21 @@ from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.model import Bar, TraderId
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.objects import Money
 
 
 from sinly_quant.constants import CATALOG_PATH
+from sinly_quant.strategies.base_strategy import BaseSinlyStrategy
 from sinly_quant.strategies.demo_strategy import DemoStrategy
+from sinly_quant.strategies.pair_ratio import _rebalance_targets
 from sinly_quant.data_prepare.instruments_providers import InstrumentProvider
 
 
@@ -128,3 +133,74 @@ def test_demo_strategy():
 
     # Clean up resources
     engine.dispose()
+
+
+def test_fills_df_with_preallocated_capacity():
+    """
+    Fills written through a preallocated buffer (below and past its capacity) should come
+    back in order, without the unused rows.
+    """
+    for expected_fills in (0, 2, 5):
+        strategy = BaseSinlyStrategy(expected_fills=expected_fills)
+        for i in range(3):
+            strategy._append_fill(
+                (1_700_000_000_000_000_000 + i, "GLD.NYSE", int(OrderSide.BUY), 1.0, 2.0, 2.0, 1.0, 100.0, f"O-{i}")
+            )
+
+        df = strategy.fills_df
+        assert df["client_order_id"].tolist() == ["O-0", "O-1", "O-2"]
+        assert df["fill_px"].dtype == "float64"
+        assert df["order_side"].tolist() == ["BUY", "BUY", "BUY"]
+        assert df["ts_event"].is_monotonic_increasing
+
+
+def test_rebalance_targets():
+    """
+    Rebalancing should size whole-share deltas towards the target split, with negative
+    deltas meaning the opposite side.
+    """
+    # All in the low asset: sell it down to 10% and buy the high asset with the rest
+    qty_to_sell_l, qty_to_buy_h, ratio_low = _rebalance_targets(10_000.0, 0.9, 50.0, 100.0, 0, 100)
+    assert (qty_to_sell_l, qty_to_buy_h) == (90, 180)
+    assert ratio_low == 1.0
+
+    # Overweight the high asset: buy back the low asset and trim the high asset
+    qty_to_sell_l, qty_to_buy_h, ratio_low = _rebalance_targets(10_000.0, 0.9, 50.0, 100.0, 200, 0)
+    assert (qty_to_sell_l, qty_to_buy_h) == (-10, -20)
+    assert ratio_low == 0.0
+
+    assert _rebalance_targets(0.0, 0.9, 50.0, 100.0, 0, 0)[2] == 0
+
+
+def test_account_cache_cleared_on_reset_and_dispose():
+    """
+    Accounts cached by get_available_cash belong to one engine run, so reset and dispose
+    should forget them.
+    """
+    strategy = BaseSinlyStrategy()
+    venue = Venue("SIM")
+
+    strategy._account_cache[venue] = object()
+    strategy.on_reset()
+    assert venue not in strategy._account_cache
+
+    strategy._account_cache[venue] = object()
+    strategy.on_dispose()
+    assert venue not in strategy._account_cache
+
+
+def test_demo_strategy_position_sides_cleared_on_reset_and_dispose():
+    """
+    Position sides mirror one engine run, a stale LONG after reset would block every later buy.
+    """
+    bar_type = BarType.from_str("GLD.NYSE-1-DAY-LAST-EXTERNAL")
+    strategy = DemoStrategy(bar_types=[bar_type])
+    instrument_id = bar_type.instrument_id
+
+    strategy._position_sides[instrument_id] = PositionSide.LONG
+    strategy.on_reset()
+    assert instrument_id not in strategy._position_sides
+
+    strategy._position_sides[instrument_id] = PositionSide.LONG
+    strategy.on_dispose()
+    assert instrument_id not in strategy._position_sides